@@ -16,6 +16,7 @@ sys.path.insert(0, 'src')
 from claude_redditor.config import settings
 from claude_redditor.db.connection import DatabaseConnection
 from claude_redditor.db.repository import Repository
+from claude_redditor.digest import extract_json, source_for_post_id
 
 # Configuration
 PROJECT = "claudeia"
@@ -55,9 +56,8 @@ print(f"  Truncated: {first_post['selftext_truncated']}")
 
 # Step 3: Load prompt template
 print("\n[Step 3] Loading prompt template...")
-from pathlib import Path
-prompt_path = Path('prompts/digest_article.md')
-prompt_template = prompt_path.read_text()
+from claude_redditor.projects import project_loader
+prompt_template = project_loader.get_prompt(PROJECT, 'digest')
 print(f"✓ Loaded template ({len(prompt_template)} chars)")
 
 # Step 4: Prepare prompt for first post
@@ -66,18 +66,9 @@ post = first_post['post']
 classification = first_post['classification']
 content = post.get('selftext', '') or 'No content available'
 
-# Determine source
-post_id = post.get('id', '')
-if post_id.startswith('reddit_'):
-    source = 'Reddit'
-elif post_id.startswith('hn_'):
-    source = 'HackerNews'
-else:
-    source = 'Unknown'
-
 prompt = prompt_template.format(
     title=post.get('title', 'Sin título'),
-    source=source,
+    source=source_for_post_id(post.get('id', '')),
     subreddit=post.get('subreddit', 'N/A') or 'N/A',
     author=post.get('author', 'unknown') or 'unknown',
     score=post.get('score', 0) or 0,
@@ -113,84 +104,24 @@ print("--- END RAW RESPONSE ---")
 
 # Step 6: Try to extract JSON
 print("\n[Step 6] Extracting JSON from response...")
-import re
 
-# Method 1: Try code block pattern (greedy match)
-code_block_pattern = r'```(?:json)?\s*(\{.*\})\s*```'
-match = re.search(code_block_pattern, response_text, re.DOTALL)
+article = extract_json(response_text)
 
-if match:
-    print("Found JSON in code block")
-    json_str = match.group(1)
+if article is None:
+    print("✗ No JSON object could be parsed from the response!")
 else:
-    print("No code block found, trying brace-matching extraction")
-
-    # Find JSON using brace matching
-    json_start = response_text.find('{')
-    if json_start == -1:
-        print("ERROR: No opening brace found!")
-        json_str = None
-    else:
-        # Count braces to find matching close
-        brace_count = 0
-        json_end = -1
-        in_string = False
-        escape_next = False
-
-        for i, char in enumerate(response_text[json_start:], start=json_start):
-            if escape_next:
-                escape_next = False
-                continue
-            if char == '\\' and in_string:
-                escape_next = True
-                continue
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            if not in_string:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        json_end = i + 1
-                        break
-
-        if json_end > json_start:
-            json_str = response_text[json_start:json_end]
-            print(f"Found JSON at positions {json_start} to {json_end}")
-        else:
-            print("ERROR: No matching closing brace found!")
-            json_str = None
-
-if json_str:
-    print(f"\n--- EXTRACTED JSON STRING ({len(json_str)} chars) ---")
+    json_str = json.dumps(article, ensure_ascii=False, indent=2)
+    print(f"\n--- EXTRACTED JSON ({len(json_str)} chars) ---")
     print(json_str[:1000])
     if len(json_str) > 1000:
         print("... (truncated)")
-    print("--- END JSON STRING ---")
-
-    # Try to parse
-    print("\n[Step 7] Parsing JSON...")
-    try:
-        article = json.loads(json_str)
-        print("✓ JSON parsed successfully!")
-        print(f"\nKeys found: {list(article.keys())}")
-        print(f"\nArticle title: {article.get('article_title', 'N/A')}")
-        print(f"Article body length: {len(article.get('article_body', ''))}")
-        print(f"Commentary length: {len(article.get('radio_commentary', ''))}")
-    except json.JSONDecodeError as e:
-        print(f"✗ JSON parse error: {e}")
-        print(f"\nError position: {e.pos}")
-        print(f"Error line: {e.lineno}, col: {e.colno}")
-
-        # Show context around error
-        if e.pos:
-            start = max(0, e.pos - 50)
-            end = min(len(json_str), e.pos + 50)
-            print(f"\nContext around error:")
-            print(f"'{json_str[start:end]}'")
-            print(f"      {'':>{e.pos - start}}^")
+    print("--- END JSON ---")
+
+    print("✓ JSON parsed successfully!")
+    print(f"\nKeys found: {list(article.keys())}")
+    print(f"\nArticle title: {article.get('article_title', 'N/A')}")
+    print(f"Article body length: {len(article.get('article_body', ''))}")
+    print(f"Commentary length: {len(article.get('radio_commentary', ''))}")
 
 print("\n" + "=" * 60)
 print("DEBUG COMPLETE")
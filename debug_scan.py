@@ -11,7 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from claude_redditor.config import settings
-from claude_redditor.scrapers.reddit import RedditScraper
+from claude_redditor.scrapers import create_reddit_scraper
 from claude_redditor.classifier import create_classifier
 from claude_redditor.analyzer import create_cached_engine
 from claude_redditor.projects import project_loader
@@ -35,7 +35,7 @@ def main():
     print(f"[DEBUG] Topic: {project.topic}\n")
 
     # Initialize scraper
-    scraper = RedditScraper()
+    scraper = create_reddit_scraper()
     print(f"[DEBUG] Reddit scraper initialized")
     print(f"[DEBUG] Mode: {scraper.mode}\n")
 
@@ -101,6 +101,11 @@ def main():
             source='reddit',
             project=project_name
         )
+        # Cache writes run in the background; wait for them so failures show up
+        try:
+            engine.flush()
+        except Exception as e:
+            print(f"[DEBUG] ⚠ Cache write failed: {e}")
 
     print(f"\n[DEBUG] Classification complete!")
     print(f"[DEBUG] Cache stats: {cache_stats['new']} new, {cache_stats['cached']} cached")
@@ -1,15 +1,54 @@
 """Analysis engine for calculating metrics from classified posts."""
 
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Mapping, Tuple, Optional
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+import bisect
+import heapq
 import logging
+import threading
 
 from .core.models import RedditPost, Classification, AnalysisReport, PostSummary
-from .core.enums import CategoryEnum
+from .core.enums import CategoryEnum, SIGNAL_CATEGORIES, NOISE_CATEGORIES, count_by_kind
 
 logger = logging.getLogger(__name__)
 
+_TOP_POSTS = 5  # Posts shown in top signal/noise lists
+
+# Health grade table: a ratio at or above _GRADE_THRESHOLDS[i] earns _GRADES[i + 1]
+_GRADE_THRESHOLDS = (0.4, 0.5, 0.6, 0.7, 0.8)
+_GRADES = ("F", "D", "C", "B", "A", "A+")
+
+
+def health_grade(signal_ratio: float) -> str:
+    """Map a signal ratio (0.0-1.0) to a grade (A+, A, B, C, D, F)."""
+    return _GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, signal_ratio)]
+
+
+def _dict_to_reddit_post(p: Dict) -> RedditPost:
+    """Build a RedditPost from a scraped post dict (positional args, no kwargs dict)."""
+    return RedditPost(
+        p['id'],
+        p['title'],
+        p.get('selftext', ''),
+        p.get('author', '[deleted]'),
+        p.get('score', 0),
+        p.get('num_comments', 0),
+        p.get('created_utc', 0),
+        p.get('url', ''),
+        p.get('subreddit', ''),
+        p.get('flair'),
+    )
+
+
+def _resolve_classifier(classifier):
+    """Return the classifier, building it first if a factory was passed."""
+    return classifier() if callable(classifier) else classifier
+
 
 class PostAnalyzer:
     """Analyzes classified Reddit posts and generates metrics."""
@@ -38,82 +77,84 @@ class PostAnalyzer:
                 f"Mismatch: {len(posts)} posts but {len(classifications)} classifications"
             )
 
-        # Build lookup dictionary for easy access
-        post_lookup = {post.id: post for post in posts}
-
-        # Calculate category distribution
-        category_counts = Counter(c.category for c in classifications)
-
-        # Count UNRELATED posts separately
-        unrelated_count = sum(1 for c in classifications if c.category == CategoryEnum.UNRELATED)
+        # Category distribution: Counter tallies in C, and the per-kind counts
+        # are derived from the tally instead of per-item increments
+        category_counts = Counter(map(attrgetter('category'), classifications))
+        kinds = count_by_kind(category_counts)
+        signal_count = kinds["signal"]
+        unrelated_count = kinds["unrelated"]
+
+        # Red flag distribution, tallied in C over the flattened flag lists
+        red_flags_counter = Counter(chain.from_iterable(map(attrgetter('red_flags'), classifications)))
+
+        # Single pass: bounded heaps with the highest-confidence signal/noise posts
+        signal_heap: List[Tuple[float, int, Classification]] = []
+        noise_heap: List[Tuple[float, int, Classification]] = []
+
+        for idx, c in enumerate(classifications):
+            category = c.category
+            if category in SIGNAL_CATEGORIES:
+                heap = signal_heap
+            elif category in NOISE_CATEGORIES:
+                heap = noise_heap
+            else:
+                continue
+
+            # -idx keeps earlier posts first on confidence ties (stable order)
+            entry = (c.confidence, -idx, c)
+            if len(heap) < _TOP_POSTS:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heappushpop(heap, entry)
 
         # Calculate signal ratio (EXCLUDE UNRELATED from denominator)
-        relevant_classifications = [
-            c for c in classifications
-            if c.category != CategoryEnum.UNRELATED
-        ]
-        signal_count = sum(
-            1 for c in relevant_classifications if CategoryEnum.is_signal(c.category)
-        )
-        signal_ratio = signal_count / len(relevant_classifications) if relevant_classifications else 0.0
-
-        # Calculate red flags distribution
-        red_flags_counter = Counter()
-        for classification in classifications:
-            for flag in classification.red_flags:
-                red_flags_counter[flag] += 1
-
-        # Get top signal posts (highest confidence in signal categories)
-        signal_posts = [
-            (post_lookup[c.post_id], c)
-            for c in classifications
-            if CategoryEnum.is_signal(c.category)
-        ]
-        signal_posts.sort(key=lambda x: x[1].confidence, reverse=True)
-        top_signal = [
-            PostSummary(
-                id=post.id,
-                title=post.title,
-                score=post.score,
-                num_comments=post.num_comments,
-                url=post.url,
-                category=classification.category,
-                confidence=classification.confidence,
-            )
-            for post, classification in signal_posts[:5]
-        ]
-
-        # Get top noise posts (highest confidence in noise categories)
-        noise_posts = [
-            (post_lookup[c.post_id], c)
-            for c in classifications
-            if c.category in CategoryEnum.noise_categories()
-        ]
-        noise_posts.sort(key=lambda x: x[1].confidence, reverse=True)
-        top_noise = [
-            PostSummary(
-                id=post.id,
-                title=post.title,
-                score=post.score,
-                num_comments=post.num_comments,
-                url=post.url,
-                category=classification.category,
-                confidence=classification.confidence,
-            )
-            for post, classification in noise_posts[:5]
-        ]
+        relevant_count = len(classifications) - unrelated_count
+        signal_ratio = signal_count / relevant_count if relevant_count else 0.0
+
+        # Callers normally pass posts and classifications in the same order, so
+        # the post for a heap entry is usually posts[idx]. Fall back to an ID
+        # lookup (built only for the <=10 posts shown) when that doesn't hold.
+        post_lookup: Optional[Dict[str, RedditPost]] = None
+
+        def post_for(idx: int, post_id: str) -> RedditPost:
+            nonlocal post_lookup
+            post = posts[idx]
+            if post.id == post_id:
+                return post
+            if post_lookup is None:
+                needed_ids = {entry[2].post_id for entry in signal_heap}
+                needed_ids.update(entry[2].post_id for entry in noise_heap)
+                post_lookup = {p.id: p for p in posts if p.id in needed_ids}
+            return post_lookup[post_id]
+
+        def summarize(heap: List[Tuple[float, int, Classification]]) -> List[PostSummary]:
+            summaries = []
+            for _, neg_idx, classification in sorted(heap, reverse=True):
+                post = post_for(-neg_idx, classification.post_id)
+                # Positional: id, title, score, num_comments, url, category, confidence
+                summaries.append(PostSummary(
+                    post.id, post.title, post.score, post.num_comments, post.url,
+                    classification.category, classification.confidence,
+                ))
+            return summaries
+
+        top_signal = summarize(signal_heap)
+        top_noise = summarize(noise_heap)
 
         # Create report
         return AnalysisReport(
             subreddit=subreddit,
             period=period,
             total_posts=len(posts),
-            category_counts=dict(category_counts),
+            category_counts=category_counts,
             signal_ratio=signal_ratio,
-            red_flags_distribution=dict(red_flags_counter),
+            red_flags_distribution=red_flags_counter,
             top_signal=top_signal,
             top_noise=top_noise,
             unrelated_count=unrelated_count,
+            signal_count=signal_count,
+            noise_count=kinds["noise"],
+            meta_count=kinds["meta"],
         )
 
     def compare_subreddits(
@@ -135,16 +176,8 @@ class PostAnalyzer:
                 "signal_ratio": report.signal_ratio,
                 "total_posts": report.total_posts,
                 "red_flags_count": sum(report.red_flags_distribution.values()),
-                "signal_count": sum(
-                    count
-                    for cat, count in report.category_counts.items()
-                    if CategoryEnum.is_signal(CategoryEnum(cat))
-                ),
-                "noise_count": sum(
-                    count
-                    for cat, count in report.category_counts.items()
-                    if CategoryEnum(cat) in CategoryEnum.noise_categories()
-                ),
+                "signal_count": report.signal_count,
+                "noise_count": report.noise_count,
             }
 
         return comparison
@@ -159,40 +192,19 @@ class PostAnalyzer:
         Returns:
             Dictionary with summary stats
         """
-        signal_categories = CategoryEnum.signal_categories()
-        noise_categories = CategoryEnum.noise_categories()
-
-        signal_count = sum(
-            count
-            for cat, count in report.category_counts.items()
-            if CategoryEnum(cat) in signal_categories
-        )
-
-        noise_count = sum(
-            count
-            for cat, count in report.category_counts.items()
-            if CategoryEnum(cat) in noise_categories
-        )
-
-        meta_count = sum(
-            count
-            for cat, count in report.category_counts.items()
-            if cat in [CategoryEnum.COMMUNITY.value, CategoryEnum.MEME.value]
-        )
-
         return {
-            "signal_count": signal_count,
-            "noise_count": noise_count,
-            "meta_count": meta_count,
+            "signal_count": report.signal_count,
+            "noise_count": report.noise_count,
+            "meta_count": report.meta_count,
             "signal_percentage": report.signal_ratio * 100,
             "health_grade": self._calculate_health_grade(report.signal_ratio),
             "top_red_flag": (
-                max(report.red_flags_distribution.items(), key=lambda x: x[1])[0]
+                report.red_flags_distribution.most_common(1)[0][0]
                 if report.red_flags_distribution
                 else None
             ),
             "most_common_category": (
-                max(report.category_counts.items(), key=lambda x: x[1])[0]
+                report.category_counts.most_common(1)[0][0]
                 if report.category_counts
                 else None
             ),
@@ -208,18 +220,7 @@ class PostAnalyzer:
         Returns:
             Grade string (A+, A, B, C, D, F)
         """
-        if signal_ratio >= 0.8:
-            return "A+"
-        elif signal_ratio >= 0.7:
-            return "A"
-        elif signal_ratio >= 0.6:
-            return "B"
-        elif signal_ratio >= 0.5:
-            return "C"
-        elif signal_ratio >= 0.4:
-            return "D"
-        else:
-            return "F"
+        return health_grade(signal_ratio)
 
 
 class CachedAnalysisEngine:
@@ -240,13 +241,20 @@ class CachedAnalysisEngine:
 
         # Only initialize DB if MySQL is configured
         if config.is_mysql_configured():
-            from .db.connection import DatabaseConnection
+            from .db.connection import get_db_connection
             from .db.repository import Repository
 
-            self.db = DatabaseConnection(config)
+            self.db = get_db_connection(config)
             self.repo = Repository(self.db)
             self.cache_enabled = True
             logger.info("Cache enabled (MariaDB)")
+
+            # New posts/classifications are written in the background so the
+            # caller can report while the inserts run. One worker keeps writes
+            # in submission order (posts before their classifications).
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-writer")
+            self._pending_writes: List[Future] = []
+            self._pending_lock = threading.Lock()  # Engine is shared by scan workers
         else:
             self.db = None
             self.repo = None
@@ -255,11 +263,12 @@ class CachedAnalysisEngine:
 
     def analyze_with_cache(
         self,
-        posts: List[Dict],
+        posts: List[Mapping],
         classifier,
         model_version: Optional[str] = None,
         source: str = 'reddit',
-        project: str = 'default'
+        project: str = 'default',
+        progress_cb: Optional[Callable[[int, int], None]] = None,
     ) -> Tuple[List[Classification], Dict]:
         """
         Analyze posts using cache (multi-source support).
@@ -267,15 +276,20 @@ class CachedAnalysisEngine:
         Flow:
         1. Check cache for post_ids
         2. Classify only posts not in cache
-        3. Save new classifications
+        3. Queue new posts + classifications for saving (background, see flush())
         4. Return all (cached + new)
 
         Args:
-            posts: List of post dicts (from scraper, with prefixed IDs)
-            classifier: PostClassifier instance
+            posts: List of post mappings (dicts or PostDictView, with
+                prefixed IDs); read only, never modified
+            classifier: PostClassifier instance, or a zero-argument factory
+                (e.g. create_classifier) called only if some posts miss the cache,
+                so fully cached runs never build an Anthropic client
             model_version: Claude model version (default: from config)
             source: Content source ('reddit' or 'hackernews')
             project: Project name (default: 'default')
+            progress_cb: Optional callback(done, total) passed to the classifier
+                for the posts that miss the cache
 
         Returns:
             (classifications, cache_stats)
@@ -289,22 +303,9 @@ class CachedAnalysisEngine:
         if not self.cache_enabled:
             logger.info(f"Classifying {len(posts)} posts (cache disabled)")
             # Convert dicts to RedditPost objects
-            posts_to_classify = [
-                RedditPost(
-                    id=p['id'],
-                    title=p['title'],
-                    selftext=p.get('selftext', ''),
-                    author=p.get('author', '[deleted]'),
-                    score=p.get('score', 0),
-                    num_comments=p.get('num_comments', 0),
-                    created_utc=p.get('created_utc', 0),
-                    url=p.get('url', ''),
-                    subreddit=p.get('subreddit', ''),
-                    flair=p.get('flair')
-                )
-                for p in posts
-            ]
-            classifications = classifier.classify_posts(posts_to_classify, project=project)
+            posts_to_classify = [_dict_to_reddit_post(p) for p in posts]
+            classifier = _resolve_classifier(classifier)
+            classifications = classifier.classify_posts(posts_to_classify, project=project, progress_cb=progress_cb)
             cache_stats = {
                 'total': len(posts),
                 'cached': 0,
@@ -320,63 +321,49 @@ class CachedAnalysisEngine:
 
         # Check cache
         cached_data = self.repo.get_cached_classifications(post_ids, source=source, project=project)
-        cached_ids = {c['post_id'] for c in cached_data}
-
-        # Convert cached data to Classification objects
-        cached_classifications = []
-        for data in cached_data:
-            cached_classifications.append(
-                Classification(
-                    post_id=data['post_id'],
-                    category=CategoryEnum(data['category']),
-                    confidence=data['confidence'],
-                    red_flags=data['red_flags'],
-                    reasoning=data['reasoning'],
-                    topic_tags=data.get('topic_tags', []),
-                    format_tag=data.get('format_tag'),
-                    tier_tags=data.get('tier_tags'),
-                    tier_clusters=data.get('tier_clusters', []),
-                    tier_scoring=data.get('tier_scoring'),
-                )
+
+        # Convert cached data to Classification objects, keyed by post ID so
+        # the same pass yields the membership set for the partition below
+        cached_by_id = {
+            d['post_id']: Classification(
+                post_id=d['post_id'],
+                category=CategoryEnum(d['category']),
+                confidence=d['confidence'],
+                red_flags=d['red_flags'],
+                reasoning=d['reasoning'],
+                topic_tags=d.get('topic_tags', []),
+                format_tag=d.get('format_tag'),
+                tier_tags=d.get('tier_tags'),
+                tier_clusters=d.get('tier_clusters', []),
+                tier_scoring=d.get('tier_scoring'),
             )
+            for d in cached_data
+        }
+        cached_classifications = list(cached_by_id.values())
 
         # Identify posts to classify
-        to_classify = [p for p in posts if p['id'] not in cached_ids]
+        to_classify = [p for p in posts if p['id'] not in cached_by_id]
 
         # Classify new posts
         new_classifications = []
         if to_classify:
             logger.info(f"Classifying {len(to_classify)} new posts...")
             # Convert dicts to RedditPost objects
-            posts_to_classify = [
-                RedditPost(
-                    id=p['id'],
-                    title=p['title'],
-                    selftext=p.get('selftext', ''),
-                    author=p.get('author', '[deleted]'),
-                    score=p.get('score', 0),
-                    num_comments=p.get('num_comments', 0),
-                    created_utc=p.get('created_utc', 0),
-                    url=p.get('url', ''),
-                    subreddit=p.get('subreddit', ''),
-                    flair=p.get('flair')
-                )
-                for p in to_classify
-            ]
-            new_classifications = classifier.classify_posts(posts_to_classify, project=project)
+            posts_to_classify = [_dict_to_reddit_post(p) for p in to_classify]
+            classifier = _resolve_classifier(classifier)
+            new_classifications = classifier.classify_posts(posts_to_classify, project=project, progress_cb=progress_cb)
 
             # Apply category-based selftext truncation before saving
-            # NOISE/UNRELATED posts get truncated to 500 chars to save storage
-            from .config import settings
+            # NOISE/UNRELATED posts get truncated to 500 chars to save storage.
+            # Truncated posts are copied: the caller's mappings stay untouched
             classification_map = {c.post_id: c.category for c in new_classifications}
+            max_selftext = self.config.max_selftext_noise
+            posts_to_save = []
             for post_dict in to_classify:
                 category = classification_map.get(post_dict['id'])
-                if category and CategoryEnum.is_low_value(category):
-                    if post_dict.get('selftext'):
-                        post_dict['selftext'] = post_dict['selftext'][:settings.max_selftext_noise]
-
-            # Save to DB (with truncated selftext for NOISE/UNRELATED)
-            self.repo.save_posts(to_classify, source=source, project=project)
+                if category and CategoryEnum.is_low_value(category) and post_dict.get('selftext'):
+                    post_dict = {**post_dict, 'selftext': post_dict['selftext'][:max_selftext]}
+                posts_to_save.append(post_dict)
 
             # Convert to dicts for saving (include ALL fields)
             new_classifications_dicts = [
@@ -394,8 +381,15 @@ class CachedAnalysisEngine:
                 }
                 for c in new_classifications
             ]
-            self.repo.save_classifications(new_classifications_dicts, source=source, model_version=model_version, project=project)
-            logger.info(f"Saved {len(new_classifications)} new classifications")
+
+            # Save to DB (with truncated selftext for NOISE/UNRELATED) without
+            # blocking the caller
+            future = self._writer.submit(
+                self._save_new, posts_to_save, new_classifications_dicts,
+                source, model_version, project,
+            )
+            with self._pending_lock:
+                self._pending_writes.append(future)
 
         # Calculate stats
         cache_stats = {
@@ -416,6 +410,34 @@ class CachedAnalysisEngine:
 
         return all_classifications, cache_stats
 
+    def _save_new(
+        self,
+        posts: List[Dict],
+        classifications: List[Dict],
+        source: str,
+        model_version: str,
+        project: str
+    ):
+        """Persist newly classified posts, then their classifications (FK order)."""
+        self.repo.save_posts(posts, source=source, project=project)
+        self.repo.save_classifications(classifications, source=source, model_version=model_version, project=project)
+        logger.info(f"Saved {len(classifications)} new classifications")
+
+    def flush(self):
+        """
+        Wait for queued cache writes to finish.
+
+        Raises the first error hit by a background write, so failures still
+        surface to the caller (just later than the classification step).
+        """
+        if not self.cache_enabled:
+            return
+        with self._pending_lock:
+            pending, self._pending_writes = self._pending_writes, []
+        errors = [e for e in (f.exception() for f in pending) if e is not None]
+        if errors:
+            raise errors[0]
+
     def save_scan_result(
         self,
         subreddit: str,
@@ -424,24 +446,53 @@ class CachedAnalysisEngine:
         source: str = 'reddit',
         project: str = 'default'
     ):
-        """Save scan result to history."""
-        if self.cache_enabled:
-            self.repo.save_scan_history(
-                subreddit=subreddit,
-                posts_fetched=cache_stats['total'],
-                posts_classified=cache_stats['new'],
-                posts_cached=cache_stats['cached'],
-                signal_ratio=signal_ratio * 100,  # Convert to percentage
-                source=source,
-                project=project
-            )
+        """
+        Save scan result to history (a single-row save_scan_results()).
+
+        Does not wait for queued cache writes: call flush() after analysis and
+        handle its errors separately, so a failed cache write never costs the
+        history row.
+        """
+        self.save_scan_results([(subreddit, cache_stats, signal_ratio, source)], project=project)
+
+    def save_scan_results(self, results: List[Tuple[str, Dict, float, str]], project: str = 'default'):
+        """
+        Save several scan results to history in one INSERT.
+
+        Does not flush queued cache writes.
+
+        Args:
+            results: (subreddit, cache_stats, signal_ratio, source) per scanned source
+            project: Project name (default: 'default')
+        """
+        if self.cache_enabled and results:
+            self.repo.save_scan_history_batch([
+                {
+                    'subreddit': subreddit,
+                    'posts_fetched': cache_stats['total'],
+                    'posts_classified': cache_stats['new'],
+                    'posts_cached': cache_stats['cached'],
+                    'signal_ratio': signal_ratio * 100,  # Convert to percentage
+                    'source': source,
+                    'project': project,
+                }
+                for subreddit, cache_stats, signal_ratio, source in results
+            ])
 
 
+@lru_cache(maxsize=1)
 def create_analyzer() -> PostAnalyzer:
-    """Factory function to create a PostAnalyzer instance."""
+    """Factory function to get the (stateless, shared) PostAnalyzer instance."""
     return PostAnalyzer()
 
 
+@lru_cache(maxsize=None)
 def create_cached_engine(config) -> CachedAnalysisEngine:
-    """Factory function to create a CachedAnalysisEngine instance."""
+    """
+    Factory function to get the shared CachedAnalysisEngine for these settings.
+
+    One engine per process means one background writer and one repository
+    for every subreddit in a scan. Settings are frozen, so they work as the
+    cache key.
+    """
     return CachedAnalysisEngine(config)
@@ -1,14 +1,33 @@
 """Claude-based post classification."""
 
+import hashlib
 import json
-from typing import List, Dict
-
-from anthropic import Anthropic
+import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+from anthropic import Anthropic, DefaultHttpxClient
+
+try:
+    import h2  # noqa: F401  -- optional, lets httpx negotiate HTTP/2
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 from .config import settings
 from .projects import project_loader
 from .core.models import RedditPost, Classification
 from .core.enums import CategoryEnum
+from .core import serialization
+
+logger = logging.getLogger(__name__)
 
 # Category correction for common LLM mistakes (maps invalid → valid)
 CATEGORY_CORRECTIONS = {
@@ -23,6 +42,153 @@ CATEGORY_CORRECTIONS = {
     "resource": "technical",
 }
 
+# Category string -> CategoryEnum, covering valid values and the corrections above
+_CATEGORY_LOOKUP: Dict[str, CategoryEnum] = {c.value: c for c in CategoryEnum}
+_CATEGORY_LOOKUP.update((bad, CategoryEnum(good)) for bad, good in CATEGORY_CORRECTIONS.items())
+
+# Batch packing (see _batch_len). Response sizes are rough per-post estimates
+# for one classify/tagging JSON object; max_tokens is what each call requests.
+_CHARS_PER_TOKEN = 4
+_POST_OVERHEAD_CHARS = 200  # JSON keys, IDs, author/subreddit/flair
+_INPUT_TOKEN_BUDGET = 80_000
+_OUTPUT_TOKEN_HEADROOM = 600
+_CLASSIFY_MAX_TOKENS = 4096
+_CLASSIFY_TOKENS_PER_POST = 120
+_TIER_MAX_TOKENS = 8192
+_TIER_TOKENS_PER_POST = 300
+
+_CONTENT_MEMO_SIZE = 2048  # Classifications kept for reuse by content (LRU)
+
+# Tools forcing structured output: the model must call the tool, so the
+# response arrives as parsed JSON instead of text to dig an array out of
+_CLASSIFY_TOOL = {
+    "name": "emit_classifications",
+    "description": "Return one classification per post_id in the input.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "classifications": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "post_id": {"type": "string"},
+                        "category": {"type": "string", "enum": [c.value for c in CategoryEnum]},
+                        "confidence": {"type": "number"},
+                        "red_flags": {"type": "array", "items": {"type": "string"}},
+                        "reasoning": {"type": "string"},
+                        "topic_tags": {"type": "array", "items": {"type": "string"}},
+                        "format_tag": {"type": ["string", "null"]},
+                    },
+                    "required": ["post_id", "category", "confidence"],
+                },
+            },
+        },
+        "required": ["classifications"],
+    },
+}
+_TIER_TOOL = {
+    "name": "emit_tier_tags",
+    "description": "Return the tier tags, clusters and scoring for each post_id in the input.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "post_id": {"type": "string"},
+                        "tier_tags": {
+                            "type": "object",
+                            "additionalProperties": {"type": "array", "items": {"type": "string"}},
+                        },
+                        "clusters": {"type": "array", "items": {"type": "string"}},
+                        "scoring": {"type": "number"},
+                    },
+                    "required": ["post_id", "tier_tags"],
+                },
+            },
+        },
+        "required": ["results"],
+    },
+}
+
+# JSON array inside a ```json fenced block in a model response
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\[[\s\S]*?\])\s*```')
+
+
+# Stands in for {posts_json} in the system prompt; the posts themselves are
+# sent as the user message so the template stays byte-identical across calls
+_POSTS_IN_USER_MESSAGE = "(The posts are provided as JSON in the user message.)"
+
+
+def _log_usage(response, label: str) -> None:
+    """Log input token accounting, including prompt cache writes/reads."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    logger.info(
+        "%s usage: input=%s cache_write=%s cache_read=%s output=%s",
+        label,
+        usage.input_tokens,
+        getattr(usage, "cache_creation_input_tokens", None) or 0,
+        getattr(usage, "cache_read_input_tokens", None) or 0,
+        usage.output_tokens,
+    )
+
+
+def _batch_len(
+    posts: List[RedditPost],
+    max_posts: int,
+    max_output_tokens: int,
+    output_tokens_per_post: int,
+) -> int:
+    """
+    Number of leading posts that fit in one API call (always at least 1).
+
+    Besides the max_posts cap, stops before the estimated response outgrows
+    max_output_tokens (minus headroom), which would truncate the JSON, or the
+    posts outgrow _INPUT_TOKEN_BUDGET. Tokens are estimated as chars / 4.
+    """
+    output_budget = max_output_tokens - _OUTPUT_TOKEN_HEADROOM
+    input_tokens = 0
+    count = 0
+    for post in posts[:max_posts]:
+        input_tokens += (len(post.title) + len(post.truncated_selftext) + _POST_OVERHEAD_CHARS) // _CHARS_PER_TOKEN
+        if count and (
+            input_tokens > _INPUT_TOKEN_BUDGET
+            or (count + 1) * output_tokens_per_post > output_budget
+        ):
+            break
+        count += 1
+    return max(count, 1)
+
+
+@lru_cache(maxsize=None)
+def get_anthropic_client(api_key: str) -> Anthropic:
+    """
+    Return the process-wide Anthropic client for an API key.
+
+    Every classifier/digest/podcast caller shares one httpx connection pool, so
+    concurrent batches reuse warm TCP+TLS connections instead of each client
+    opening its own. HTTP/2 is used when the optional h2 package is installed.
+    """
+    http_client = DefaultHttpxClient(
+        http2=_HTTP2_AVAILABLE,
+        # Keep idle connections well past httpx's 5s default: a classify or
+        # tagging call can take longer than that, and every expired
+        # connection means a new TCP+TLS handshake for the next batch
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60),
+    )
+    # The SDK retries 429/5xx itself with exponential backoff + jitter and
+    # honors Retry-After; only the attempt count is configurable here
+    return Anthropic(
+        api_key=api_key,
+        http_client=http_client,
+        max_retries=settings.anthropic_max_retries,
+    )
+
 
 class PostClassifier:
     """Classifies Reddit posts using Claude API."""
@@ -34,13 +200,51 @@ class PostClassifier:
                 "Anthropic API key required. Set ANTHROPIC_API_KEY in .env file."
             )
 
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
+        self.client = get_anthropic_client(settings.anthropic_api_key)
         self.model = settings.anthropic_model
 
-        # Cache for loaded prompts per project
-        self._prompt_cache: Dict[str, str] = {}
-
-    def classify_posts(self, posts: List[RedditPost], batch_size: int = None, project: str = 'default') -> List[Classification]:
+        # Cached system prompt blocks per (project, prompt name)
+        self._prompt_cache: Dict[Tuple[str, str], List[Dict]] = {}
+
+        # Classifications already produced in this process, keyed by content hash
+        # (see _content_key), least recently used first. Lets repeated scans
+        # skip the API for unchanged posts; bounded because the classifier
+        # lives as long as the process. Scans share the classifier across
+        # threads, hence the lock.
+        self._content_memo: "OrderedDict[str, Classification]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    @staticmethod
+    def _content_key(post: RedditPost, project: str) -> str:
+        """Hash of every prompt field that determines a classification, except the ID."""
+        content = "\0".join((
+            project, post.title, post.truncated_selftext,
+            post.author or "", post.subreddit or "", post.flair or "",
+        ))
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _memo_get(self, key: str) -> Optional[Classification]:
+        with self._memo_lock:
+            cls = self._content_memo.get(key)
+            if cls is not None:
+                self._content_memo.move_to_end(key)
+            return cls
+
+    def _memo_put(self, key: str, cls: Classification) -> None:
+        with self._memo_lock:
+            self._content_memo[key] = cls
+            self._content_memo.move_to_end(key)
+            if len(self._content_memo) > _CONTENT_MEMO_SIZE:
+                self._content_memo.popitem(last=False)
+
+    def classify_posts(
+        self,
+        posts: List[RedditPost],
+        batch_size: int = None,
+        project: str = 'default',
+        progress_cb: Optional[Callable[[int, int], None]] = None,
+        use_memo: bool = True,
+    ) -> List[Classification]:
         """
         Classify a list of posts using Claude API (two-pass classification).
 
@@ -48,6 +252,11 @@ class PostClassifier:
             posts: List of RedditPost objects to classify
             batch_size: Number of posts per API request (default from settings)
             project: Project name (default: 'default')
+            progress_cb: Optional callback(done, total), called from this
+                thread as category batches complete
+            use_memo: Reuse classifications of identical content (earlier in
+                the process or within this call). False sends every post to
+                the API, as --no-cache promises.
 
         Returns:
             List of Classification objects with tier data
@@ -55,151 +264,303 @@ class PostClassifier:
         if batch_size is None:
             batch_size = settings.default_batch_size
 
-        all_classifications = []
-
-        # STEP 1: Process category classifications in batches
-        for i in range(0, len(posts), batch_size):
-            batch = posts[i : i + batch_size]
-            try:
-                classifications = self._classify_batch(batch, project=project)
-                all_classifications.extend(classifications)
-            except ValueError as e:
-                if "refusal" in str(e).lower():
-                    # API refused the batch - retry with smaller batches
-                    # this happens when the content is "problematic" for the IA (non ethical hacking, smut, etc...)
-                    # We try to classify each post individually to skip the problematic one/s
-                    print(f"⚠ Batch refused by API, retrying with individual posts...")
-                    for post in batch:
-                        try:
-                            single_result = self._classify_batch([post], project=project)
-                            all_classifications.extend(single_result)
-                        except ValueError as e2:
-                            if "refusal" in str(e2).lower():
-                                print(f"⚠ Skipping post {post.id} (content refused by API)")
-                            else:
-                                raise
+        # Reuse classifications of identical content seen earlier in this
+        # process, and send only one copy of content repeated within this call
+        content_keys: Dict[str, str] = {}
+        memo_hits: Dict[str, Classification] = {}
+        duplicates = []
+        if use_memo:
+            content_keys = {post.id: self._content_key(post, project) for post in posts}
+            to_classify = []
+            queued_keys = set()
+            for post in posts:
+                key = content_keys[post.id]
+                cached = self._memo_get(key)
+                if cached is not None:
+                    memo_hits[post.id] = replace(cached, post_id=post.id)
+                elif key in queued_keys:
+                    duplicates.append(post)
                 else:
-                    raise
+                    queued_keys.add(key)
+                    to_classify.append(post)
+        else:
+            to_classify = posts
+
+        if memo_hits:
+            logger.info("Reusing %d classifications of identical content", len(memo_hits))
+        if duplicates:
+            logger.info("%d posts duplicate other posts in this run; classifying each content once", len(duplicates))
+
+        if progress_cb is None:
+            batch_done = None
+        else:
+            total = len(posts)
+            already_done = len(memo_hits)
+            progress_cb(already_done, total)
+
+            def batch_done(done: int) -> None:
+                progress_cb(already_done + done, total)
+
+        all_classifications = self._classify_uncached(to_classify, batch_size, project, batch_done)
+
+        classified_by_key: Dict[str, Classification] = {}
+        for cls in all_classifications:
+            key = content_keys.get(cls.post_id)
+            if key is not None:
+                classified_by_key[key] = cls
+                self._memo_put(key, cls)
+
+        # Fan results out to the duplicates (none if their original failed)
+        for post in duplicates:
+            cls = classified_by_key.get(content_keys[post.id])
+            if cls is not None:
+                memo_hits[post.id] = replace(cls, post_id=post.id)
+
+        if progress_cb is not None:
+            progress_cb(len(posts), len(posts))
+
+        if not memo_hits:
+            return all_classifications
+
+        # Preserve input order
+        results = {cls.post_id: cls for cls in all_classifications}
+        results.update(memo_hits)
+        return [results[post.id] for post in posts if post.id in results]
+
+    def _classify_uncached(
+        self,
+        posts: List[RedditPost],
+        batch_size: int,
+        project: str,
+        batch_done: Optional[Callable[[int], None]] = None,
+    ) -> List[Classification]:
+        """
+        Run the two-pass (category + tier) classification against the API.
+
+        batch_done, if given, receives the number of posts whose category
+        batch has completed so far.
+        """
+        if not posts:
+            return []
 
-        # STEP 2: Tier classification (only for non-UNRELATED posts)
         # Check if project has tagging.md prompt (tier system is optional)
         try:
             self._get_tier_prompt_template(project)
             has_tier_system = True
         except FileNotFoundError:
             has_tier_system = False
-            print(f"ℹ No tier tagging system found for project '{project}' (tagging.md missing)")
-
-        if has_tier_system:
-            # Filter posts eligible for tier classification
-            tier_eligible_posts = []
-            for post, cls in zip(posts, all_classifications):
-                if cls.category != CategoryEnum.UNRELATED:
-                    tier_eligible_posts.append(post)
-
-            if tier_eligible_posts:
-                print(f"🏷️  Starting tier classification for {len(tier_eligible_posts)} posts...")
-
-                # Process tiers in batches
-                for i in range(0, len(tier_eligible_posts), batch_size):
-                    batch = tier_eligible_posts[i : i + batch_size]
-                    try:
-                        tier_results = self._classify_tiers_batch(batch, project=project)
-
-                        # Merge tier data into classifications
-                        tier_map = {t['post_id']: t for t in tier_results}
-                        merged_count = 0
-                        for cls in all_classifications:
-                            if cls.post_id in tier_map:
-                                tier_data = tier_map[cls.post_id]
-                                cls.tier_tags = tier_data.get('tier_tags')
-                                cls.tier_clusters = tier_data.get('clusters', [])
-                                cls.tier_scoring = tier_data.get('scoring')
-                                merged_count += 1
-
-                        print(f"  📌 Merged tier data for {merged_count}/{len(tier_results)} posts")
-
-                    except Exception as e:
-                        print(f"⚠ Warning: Tier classification failed for batch: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        # Continue without tier data for this batch
-
-                print(f"✓ Tier classification complete")
+            logger.info("No tier tagging system found for project '%s' (tagging.md missing)", project)
+
+        # STEP 1: Process category classifications in batches. Calls are
+        # network-bound, so batches run concurrently (the Anthropic client is
+        # thread-safe and retries 429/5xx responses with backoff itself).
+        # STEP 2 (tier classification, only for non-UNRELATED posts) is
+        # pipelined: eligible posts are queued for tier batches as soon as
+        # their category batch completes, on the same pool.
+        # Batches hold up to batch_size posts, fewer if their input or the
+        # expected response would overflow a single call (see _batch_len)
+        batches = []
+        i = 0
+        while i < len(posts):
+            n = _batch_len(posts[i:], batch_size, _CLASSIFY_MAX_TOKENS, _CLASSIFY_TOKENS_PER_POST)
+            batches.append(posts[i : i + n])
+            i += n
+        batch_results: List[List[Classification]] = [[] for _ in batches]
+        tier_futures = []
+        tier_pending: List[RedditPost] = []
+        tier_eligible_count = 0
+        categorized = 0
+
+        max_workers = max(1, min(settings.classifier_concurrency, len(batches)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._classify_batch_with_fallback, batch, project): i
+                for i, batch in enumerate(batches)
+            }
+            try:
+                for future in as_completed(futures):
+                    i = futures[future]
+                    batch_results[i] = future.result()
+                    if batch_done is not None:
+                        categorized += len(batches[i])
+                        batch_done(categorized)
+                    if not has_tier_system:
+                        continue
+
+                    eligible_ids = {
+                        cls.post_id for cls in batch_results[i]
+                        if cls.category != CategoryEnum.UNRELATED
+                    }
+                    eligible = [post for post in batches[i] if post.id in eligible_ids]
+                    tier_eligible_count += len(eligible)
+                    tier_pending.extend(eligible)
+                    # Submit every full tier batch; the remainder waits for more posts
+                    while tier_pending:
+                        n = _batch_len(tier_pending, batch_size, _TIER_MAX_TOKENS, _TIER_TOKENS_PER_POST)
+                        if n == len(tier_pending) and n < batch_size:
+                            break
+                        tier_batch, tier_pending = tier_pending[:n], tier_pending[n:]
+                        tier_futures.append(
+                            executor.submit(self._classify_tiers_batch_safe, tier_batch, project)
+                        )
+            except BaseException:
+                # Don't start queued calls once a batch has failed for good
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+            while tier_pending:
+                n = _batch_len(tier_pending, batch_size, _TIER_MAX_TOKENS, _TIER_TOKENS_PER_POST)
+                tier_batch, tier_pending = tier_pending[:n], tier_pending[n:]
+                tier_futures.append(
+                    executor.submit(self._classify_tiers_batch_safe, tier_batch, project)
+                )
+
+            all_classifications = list(chain.from_iterable(batch_results))
+
+            if tier_futures:
+                logger.info("Tier classification for %d posts (%d batches)", tier_eligible_count, len(tier_futures))
+                cls_by_id = {cls.post_id: cls for cls in all_classifications}
+
+                for future in tier_futures:
+                    tier_results = future.result()
+                    if not tier_results:
+                        continue  # Failed batch (already reported)
+
+                    # Merge tier data into classifications
+                    merged_count = 0
+                    for tier_data in tier_results:
+                        cls = cls_by_id.get(tier_data.get('post_id'))
+                        if cls is not None:
+                            cls.tier_tags = tier_data.get('tier_tags')
+                            cls.tier_clusters = tier_data.get('clusters', [])
+                            cls.tier_scoring = tier_data.get('scoring')
+                            merged_count += 1
+
+                    logger.info("Merged tier data for %d/%d posts", merged_count, len(tier_results))
+
+                logger.info("Tier classification complete")
 
         return all_classifications
 
-    def _get_prompt_template(self, project: str) -> str:
+    def _classify_tiers_batch_safe(self, batch: List[RedditPost], project: str) -> List[Dict]:
+        """Tier-tag a batch; a failed batch just leaves its posts without tier data."""
+        try:
+            return self._classify_tiers_batch(batch, project=project)
+        except Exception as e:
+            logger.exception("Tier classification failed for batch: %s", e)
+            return []
+
+    def _classify_batch_with_fallback(self, batch: List[RedditPost], project: str) -> List[Classification]:
+        """Classify a batch, retrying post by post if the API refuses the batch."""
+        try:
+            return self._classify_batch(batch, project=project)
+        except ValueError as e:
+            if "refusal" not in str(e).lower():
+                raise
+
+        # API refused the batch - retry with smaller batches
+        # this happens when the content is "problematic" for the IA (non ethical hacking, smut, etc...)
+        # We try to classify each post individually to skip the problematic one/s
+        logger.warning("Batch refused by API, retrying with individual posts")
+        classifications = []
+        for post in batch:
+            try:
+                classifications.extend(self._classify_batch([post], project=project))
+            except ValueError as e2:
+                if "refusal" in str(e2).lower():
+                    logger.warning("Skipping post %s (content refused by API)", post.id)
+                else:
+                    raise
+        return classifications
+
+    def _get_system_prompt(self, project: str, prompt_name: str) -> List[Dict]:
         """
-        Get the classification prompt template for a project.
+        Build the cacheable system prompt for a project template once.
+
+        The template is rendered with the project topic and without the posts,
+        and marked with cache_control so Anthropic's prompt cache can serve it
+        on every batch after the first.
+        """
+        key = (project, prompt_name)
+        if key not in self._prompt_cache:
+            prompt = project_loader.get_prompt(project, prompt_name)
+            prompt = prompt.replace("{posts_json}", _POSTS_IN_USER_MESSAGE)
+            prompt = prompt.replace("{topic}", project_loader.load(project).topic)
+            self._prompt_cache[key] = [{
+                "type": "text",
+                "text": prompt,
+                "cache_control": {"type": "ephemeral"},
+            }]
+        return self._prompt_cache[key]
+
+    def _get_prompt_template(self, project: str) -> List[Dict]:
+        """
+        Get the classification system prompt for a project.
 
         Args:
             project: Project name
 
         Returns:
-            Prompt template string
+            System prompt blocks (see _get_system_prompt)
         """
-        if project not in self._prompt_cache:
-            self._prompt_cache[project] = project_loader.get_prompt(project, 'classify')
-        return self._prompt_cache[project]
+        return self._get_system_prompt(project, 'classify')
 
     def _classify_batch(self, posts: List[RedditPost], project: str = 'default') -> List[Classification]:
         """Classify a batch of posts with a single Claude API call."""
 
-        # Load project configuration
-        proj = project_loader.load(project)
-
         # Prepare posts as JSON for the prompt
-        posts_data = []
-        for post in posts:
-            posts_data.append({
+        posts_data = [
+            {
                 "post_id": post.id,
                 "title": post.title,
                 "selftext": post.truncated_selftext,
                 "author": post.author,
                 "subreddit": post.subreddit,
                 "flair": post.flair,
-            })
+            }
+            for post in posts
+        ]
 
-        posts_json = json.dumps(posts_data, indent=2)
+        posts_json = serialization.dumps(posts_data)
 
-        # Build the prompt from project-specific template
-        prompt_template = self._get_prompt_template(project)
-        prompt = prompt_template.replace("{posts_json}", posts_json)
-        prompt = prompt.replace("{topic}", proj.topic)
+        # Project-specific template as the (cached) system prompt
+        system = self._get_prompt_template(project)
 
         # Call Claude API
-        print(f"🤖 Classifying {len(posts)} posts with {self.model}...")
+        logger.info("Classifying %d posts with %s", len(posts), self.model)
 
         try:
             response = self.client.messages.create(
                 model=self.model,
-                max_tokens=4096,
-                messages=[{"role": "user", "content": prompt}],
+                max_tokens=_CLASSIFY_MAX_TOKENS,
+                system=system,
+                messages=[{"role": "user", "content": posts_json}],
+                tools=[_CLASSIFY_TOOL],
+                tool_choice={"type": "tool", "name": _CLASSIFY_TOOL["name"]},
             )
+            _log_usage(response, "Classification")
 
-            # Extract text response
             if not response.content:
                 raise ValueError(f"Empty response from Claude API. Stop reason: {response.stop_reason}")
-            response_text = response.content[0].text
 
-            # Parse JSON response
-            classifications_data = self._extract_json(response_text)
+            # Structured tool input (falls back to parsing text)
+            classifications_data = self._response_items(response, _CLASSIFY_TOOL["name"], "classifications")
 
             # Convert to Classification objects
             classifications = []
             for data in classifications_data:
                 try:
-                    # Auto-correct common LLM category mistakes
+                    # Resolve the category (auto-correcting common LLM mistakes)
                     category = data["category"]
-                    if category in CATEGORY_CORRECTIONS:
-                        corrected = CATEGORY_CORRECTIONS[category]
-                        print(f"⚠ Auto-corrected category '{category}' → '{corrected}' for {data['post_id']}")
-                        category = corrected
+                    resolved = _CATEGORY_LOOKUP.get(category)
+                    if resolved is None:
+                        resolved = CategoryEnum(category)  # Raises ValueError for unknown values
+                    elif resolved.value != category:
+                        logger.warning("Auto-corrected category '%s' → '%s' for %s", category, resolved.value, data['post_id'])
 
                     classification = Classification(
                         post_id=data["post_id"],
-                        category=CategoryEnum(category),
+                        category=resolved,
                         confidence=float(data["confidence"]),
                         red_flags=data.get("red_flags", []),
                         reasoning=data.get("reasoning", ""),
@@ -208,30 +569,30 @@ class PostClassifier:
                     )
                     classifications.append(classification)
                 except (KeyError, ValueError) as e:
-                    print(f"⚠ Warning: Failed to parse classification for post {data.get('post_id', 'unknown')}: {e}")
+                    logger.warning("Failed to parse classification for post %s: %s", data.get('post_id', 'unknown'), e)
 
-            print(f"✓ Successfully classified {len(classifications)} posts")
+            logger.info("Successfully classified %d posts", len(classifications))
             return classifications
 
         except Exception as e:
-            print(f"✗ Error calling Claude API: {e}")
+            logger.error("Error calling Claude API: %s", e)
             raise
 
-    def _get_tier_prompt_template(self, project: str) -> str:
+    def _get_tier_prompt_template(self, project: str) -> List[Dict]:
         """
-        Get the tier classification prompt template for a project.
+        Get the tier classification system prompt for a project.
 
         Args:
             project: Project name
 
         Returns:
-            Tier prompt template string
+            System prompt blocks (see _get_system_prompt)
 
         Raises:
             FileNotFoundError: If tagging.md doesn't exist for project
         """
         try:
-            return project_loader.get_prompt(project, 'tagging')
+            return self._get_system_prompt(project, 'tagging')
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Tier tagging prompt not found for project '{project}'. "
@@ -249,96 +610,119 @@ class PostClassifier:
         Returns:
             List of dicts with tier_tags, clusters, scoring
         """
-        # Load project configuration
-        proj = project_loader.load(project)
-
         # Prepare posts as JSON for the prompt
-        posts_data = []
-        for post in posts:
-            posts_data.append({
+        posts_data = [
+            {
                 "post_id": post.id,
                 "title": post.title,
                 "selftext": post.truncated_selftext,
                 "author": post.author,
                 "subreddit": post.subreddit,
-            })
+            }
+            for post in posts
+        ]
 
-        posts_json = json.dumps(posts_data, indent=2)
+        posts_json = serialization.dumps(posts_data)
 
-        # Build the prompt from project-specific tier template
-        prompt_template = self._get_tier_prompt_template(project)
-        prompt = prompt_template.replace("{posts_json}", posts_json)
-        prompt = prompt.replace("{topic}", proj.topic)
+        # Project-specific tier template as the (cached) system prompt
+        system = self._get_tier_prompt_template(project)
 
         # Call Claude API with higher token limit for tier output
-        print(f"🏷️  Tier-tagging {len(posts)} posts with {self.model}...")
+        logger.info("Tier-tagging %d posts with %s", len(posts), self.model)
 
         try:
             response = self.client.messages.create(
                 model=self.model,
-                max_tokens=8192,  # Tiers need more output space
-                messages=[{"role": "user", "content": prompt}],
+                max_tokens=_TIER_MAX_TOKENS,  # Tiers need more output space
+                system=system,
+                messages=[{"role": "user", "content": posts_json}],
+                tools=[_TIER_TOOL],
+                tool_choice={"type": "tool", "name": _TIER_TOOL["name"]},
             )
+            _log_usage(response, "Tier tagging")
 
-            # Extract text response
             if not response.content:
                 raise ValueError(f"Empty response from Claude API. Stop reason: {response.stop_reason}")
-            response_text = response.content[0].text
 
-            # Parse JSON response - tier responses are array of objects
-            tier_results = self._extract_json(response_text)
+            # Structured tool input (falls back to parsing text) - array of objects
+            tier_results = self._response_items(response, _TIER_TOOL["name"], "results")
 
-            # Debug: print first result structure
+            # Debug: log first result structure
             if tier_results:
-                print(f"📋 First tier result keys: {list(tier_results[0].keys())}")
+                logger.debug("First tier result keys: %s", list(tier_results[0].keys()))
 
-            print(f"✓ Successfully tier-tagged {len(tier_results)} posts")
+            logger.info("Successfully tier-tagged %d posts", len(tier_results))
             return tier_results
 
         except Exception as e:
-            print(f"✗ Error calling Claude API for tier tagging: {e}")
-            print(f"Response preview: {response_text[:500] if 'response_text' in locals() else 'N/A'}...")
+            logger.error("Error calling Claude API for tier tagging: %s", e)
+            if 'response' in locals():
+                logger.error("Response preview: %.500s...", response.content)
             raise
 
+    def _response_items(self, response, tool_name: str, key: str) -> list:
+        """
+        Get the result array from a forced tool call.
+
+        Falls back to _extract_json on the text blocks if the model answered
+        in prose instead of calling the tool.
+        """
+        for block in response.content:
+            if block.type == "tool_use" and block.name == tool_name:
+                items = block.input.get(key)
+                if isinstance(items, str):
+                    # Occasionally the array comes back JSON-encoded as a string
+                    items = serialization.loads(items)
+                if isinstance(items, list):
+                    return items
+
+        response_text = "".join(block.text for block in response.content if block.type == "text")
+        return self._extract_json(response_text)
+
+    # Shared decoder for _extract_json; raw_decode parses in place from an offset
+    _json_decoder = json.JSONDecoder()
+
     def _extract_json(self, text: str) -> list:
         """Extract JSON array from Claude's response."""
         # Try to find JSON in the response - handle markdown code blocks
         # Look for ```json ... ``` first
-        import re
-        json_block_match = re.search(r'```(?:json)?\s*(\[[\s\S]*?\])\s*```', text)
+        json_block_match = _JSON_BLOCK_RE.search(text)
         if json_block_match:
             json_str = json_block_match.group(1)
-        else:
-            # Fallback: find first [ to matching ]
-            start_idx = text.find("[")
-            if start_idx == -1:
-                raise ValueError("No JSON array found in response")
-
-            # Find the matching closing bracket (handling nested arrays)
-            bracket_count = 0
-            end_idx = start_idx
-            for i, char in enumerate(text[start_idx:], start_idx):
-                if char == '[':
-                    bracket_count += 1
-                elif char == ']':
-                    bracket_count -= 1
-                    if bracket_count == 0:
-                        end_idx = i + 1
-                        break
-
-            if end_idx <= start_idx:
-                raise ValueError("No matching ] found in response")
-
-            json_str = text[start_idx:end_idx]
+            try:
+                return serialization.loads(json_str)
+            except json.JSONDecodeError as e:
+                logger.warning("JSON parsing error: %s", e)
+                logger.warning("Extracted JSON: %.500s...", json_str)
+                raise
+
+        # Fallback: decode straight from the first [. raw_decode stops at the
+        # matching ] (brackets inside strings included) without slicing out a
+        # substring first.
+        start_idx = text.find("[")
+        if start_idx == -1:
+            raise ValueError("No JSON array found in response")
 
         try:
-            return json.loads(json_str)
+            result, _end = self._json_decoder.raw_decode(text, start_idx)
         except json.JSONDecodeError as e:
-            print(f"⚠ JSON parsing error: {e}")
-            print(f"Extracted JSON: {json_str[:500]}...")
+            logger.warning("JSON parsing error: %s", e)
+            logger.warning("Extracted JSON: %s...", text[start_idx:start_idx + 500])
             raise
+        return result
 
 
-def create_classifier() -> PostClassifier:
-    """Factory function to create a PostClassifier instance."""
+@lru_cache(maxsize=1)
+def _get_classifier(api_key: str, model: str) -> PostClassifier:
+    """Build the PostClassifier for a given API key/model (cached)."""
     return PostClassifier()
+
+
+def create_classifier() -> PostClassifier:
+    """
+    Factory function to get the PostClassifier instance.
+
+    The instance (and its Anthropic client connection pool) is shared while
+    the API key and model stay the same.
+    """
+    return _get_classifier(settings.anthropic_api_key, settings.anthropic_model)
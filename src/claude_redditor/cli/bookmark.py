@@ -4,10 +4,9 @@ import json
 import typer
 from typing import Optional
 from datetime import datetime
-from rich import print as rprint
 
 from ..config import settings
-from .helpers import ensure_mysql_configured, render_bookmarks_list, render_digest_stories
+from .helpers import ensure_mysql_configured, get_repo, render_bookmarks_list, render_digest_stories, rprint
 
 app = typer.Typer(
     name="bookmark",
@@ -135,11 +134,7 @@ def bookmark_add(
         raise typer.Exit(1)
 
     # Save to database
-    from ..db.connection import DatabaseConnection
-    from ..db.repository import Repository
-
-    db = DatabaseConnection(settings)
-    repo = Repository(db)
+    repo = get_repo(settings)
 
     try:
         repo.add_bookmark(
@@ -195,11 +190,7 @@ def bookmark_list(
     """
     ensure_mysql_configured(settings)
 
-    from ..db.connection import DatabaseConnection
-    from ..db.repository import Repository
-
-    db = DatabaseConnection(settings)
-    repo = Repository(db)
+    repo = get_repo(settings)
 
     # Get bookmarks
     bookmarks = repo.get_bookmarks(status=status if status != 'all' else None, limit=limit)
@@ -229,11 +220,7 @@ def bookmark_done(
     """
     ensure_mysql_configured(settings)
 
-    from ..db.connection import DatabaseConnection
-    from ..db.repository import Repository
-
-    db = DatabaseConnection(settings)
-    repo = Repository(db)
+    repo = get_repo(settings)
 
     updated = repo.update_bookmark_status(story_id, 'done')
 
@@ -268,11 +255,7 @@ def bookmark_status(
         rprint(f"[red]Invalid status '{new_status}'. Use: to_read, to_implement, done[/red]")
         raise typer.Exit(1)
 
-    from ..db.connection import DatabaseConnection
-    from ..db.repository import Repository
-
-    db = DatabaseConnection(settings)
-    repo = Repository(db)
+    repo = get_repo(settings)
 
     updated = repo.update_bookmark_status(story_id, new_status)
 
@@ -311,11 +294,7 @@ def bookmark_export(
     """
     ensure_mysql_configured(settings)
 
-    from ..db.connection import DatabaseConnection
-    from ..db.repository import Repository
-
-    db = DatabaseConnection(settings)
-    repo = Repository(db)
+    repo = get_repo(settings)
 
     # Get enriched bookmarks from view
     bookmarks = repo.get_rich_bookmarks(
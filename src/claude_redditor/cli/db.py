@@ -2,12 +2,9 @@
 
 import typer
 from typing import Optional
-from rich import print as rprint
-from rich.table import Table
-from rich.panel import Panel
 
 from ..config import settings
-from .helpers import console, ensure_mysql_configured
+from .helpers import console, ensure_mysql_configured, get_repo, rprint
 
 app = typer.Typer()
 
@@ -29,12 +26,12 @@ def init_db():
         rprint("[yellow]Add MYSQL_* variables to .env file[/yellow]\n")
         raise typer.Exit(1)
 
-    from ..db.connection import DatabaseConnection
+    from ..db.connection import get_db_connection
 
     rprint("\n[cyan]Initializing database...[/cyan]\n")
 
     try:
-        db = DatabaseConnection(settings)
+        db = get_db_connection(settings)
 
         # Test connection
         if not db.test_connection():
@@ -88,11 +85,9 @@ def history(
     ensure_mysql_configured(settings)
 
     try:
-        from ..db.connection import DatabaseConnection
-        from ..db.repository import Repository
+        from rich.table import Table
 
-        db = DatabaseConnection(settings)
-        repo = Repository(db)
+        repo = get_repo(settings)
 
         history_data = repo.get_scan_history(subreddit, limit, project)
 
@@ -102,12 +97,12 @@ def history(
 
         # Create table
         table = Table(title="📈 Scan History")
-        table.add_column("Date", style="cyan")
+        table.add_column("Date", style="cyan", no_wrap=True)
         table.add_column("Subreddit", style="bold")
-        table.add_column("Fetched", justify="right")
-        table.add_column("Classified", justify="right", style="cyan")
-        table.add_column("Cached", justify="right", style="green")
-        table.add_column("Signal %", justify="right", style="bold")
+        table.add_column("Fetched", justify="right", no_wrap=True)
+        table.add_column("Classified", justify="right", style="cyan", no_wrap=True)
+        table.add_column("Cached", justify="right", style="green", no_wrap=True)
+        table.add_column("Signal %", justify="right", style="bold", no_wrap=True)
 
         for scan in history_data:
             table.add_row(
@@ -148,14 +143,13 @@ def cache_stats(
     ensure_mysql_configured(settings)
 
     try:
-        from ..db.connection import DatabaseConnection
-        from ..db.repository import Repository
+        from rich.panel import Panel
 
-        db = DatabaseConnection(settings)
-        repo = Repository(db)
+        repo = get_repo(settings)
 
-        total_posts = repo.get_total_cached_posts(project)
-        total_classifications = repo.get_total_classifications(project)
+        summary = repo.get_cache_summary(project)
+        total_posts = summary['posts']
+        total_classifications = summary['classifications']
 
         # Create panel
         project_label = f" (Project: {project})" if project else ""
@@ -216,9 +210,10 @@ def regenerate_json(
     from sqlalchemy import text
 
     try:
-        from ..db.connection import DatabaseConnection
+        from ..db.connection import get_db_connection
+        from ..digest import story_source_label
 
-        db = DatabaseConnection(settings)
+        db = get_db_connection(settings)
 
         with db.get_session() as session:
             # Get available digest dates
@@ -291,13 +286,7 @@ def regenerate_json(
                 # Build stories array
                 stories = []
                 for idx, row in enumerate(rows, 1):
-                    # Determine source from post ID
-                    if row.id.startswith('reddit_'):
-                        source = f"r/{row.subreddit}" if row.subreddit else "Reddit"
-                    elif row.id.startswith('hn_'):
-                        source = "HackerNews"
-                    else:
-                        source = "Unknown"
+                    source = story_source_label(row.id, row.subreddit)
 
                     # Parse JSON fields if they're strings
                     topic_tags = row.topic_tags
@@ -396,16 +385,13 @@ def regenerate_tiers(
     """
     ensure_mysql_configured(settings)
 
-    from ..db.connection import DatabaseConnection
-    from ..db.repository import Repository
     from ..classifier import create_classifier
     from ..core.models import RedditPost
 
     try:
         rprint(f"\n[cyan]Regenerating tier tags for project: {project}[/cyan]\n")
 
-        db = DatabaseConnection(settings)
-        repo = Repository(db)
+        repo = get_repo(settings)
         classifier = create_classifier()
 
         # Determine category filter
@@ -3,11 +3,10 @@
 import typer
 from typing import Optional
 from pathlib import Path
-from rich import print as rprint
-from rich.table import Table
 
 from ..config import settings
-from .helpers import console, ensure_mysql_configured
+from ..core.enums import DigestFormat
+from .helpers import console, ensure_mysql_configured, get_repo, rprint
 
 app = typer.Typer()
 
@@ -39,11 +38,16 @@ def digest(
         "--min-confidence",
         help="Minimum classification confidence threshold (0.0-1.0)"
     ),
-    format: str = typer.Option(
-        "both",
+    format: DigestFormat = typer.Option(
+        DigestFormat.BOTH,
         "--format", "-f",
         help="Output format: 'markdown', 'json' (for web), or 'both' (default)"
     ),
+    json_paths: bool = typer.Option(
+        False,
+        "--json-paths",
+        help="Print the generated file paths as one JSON line instead of 'format: path' lines"
+    ),
 ):
     """
     Generate daily digest of top signal posts.
@@ -56,6 +60,10 @@ def digest(
     Posts are marked as 'sent' after successful generation,
     so they won't appear in future digests.
 
+    For automation (N8N), the generated paths are printed to stdout
+    without markup, one 'format: path' line each, or with --json-paths
+    as a single line: {"markdown": "<path>", "json": "<path>"}.
+
     Examples:
 
         reddit-analyzer digest --project claudeia --limit 15
@@ -63,20 +71,20 @@ def digest(
         reddit-analyzer digest --project claudeia --dry-run
 
         reddit-analyzer digest -p claudeia -l 10 -o /tmp/digests
+
+        reddit-analyzer digest -p claudeia --json-paths
     """
     ensure_mysql_configured(settings)
 
     try:
-        from ..db.connection import DatabaseConnection
-        from ..db.repository import Repository
+        from rich.table import Table
         from ..digest import DigestGenerator
 
-        db = DatabaseConnection(settings)
-        repo = Repository(db)
+        repo = get_repo(settings)
 
         if dry_run:
             # Preview mode: show posts that would be included
-            posts_data = repo.get_signal_posts_for_digest(
+            posts_data = repo.get_signal_posts_summary_for_digest(
                 project=project,
                 limit=limit,
                 min_confidence=min_confidence
@@ -90,22 +98,20 @@ def digest(
             rprint(f"\n[bold cyan]Preview: {len(posts_data)} posts would be included in digest[/bold cyan]\n")
 
             table = Table(title=f"Digest Preview - {project}")
-            table.add_column("#", style="dim", width=3)
+            table.add_column("#", style="dim", width=3, no_wrap=True)
             table.add_column("Title", max_width=50)
-            table.add_column("Score", justify="right", width=6)
+            table.add_column("Score", justify="right", width=6, no_wrap=True)
             table.add_column("Category", width=15)
-            table.add_column("Confidence", justify="right", width=10)
-            table.add_column("Truncated?", width=10)
+            table.add_column("Confidence", justify="right", width=10, no_wrap=True)
+            table.add_column("Truncated?", width=10, no_wrap=True)
 
             for i, item in enumerate(posts_data, 1):
-                post = item['post']
-                classification = item['classification']
                 table.add_row(
                     str(i),
-                    post.get('title', '')[:50],
-                    str(post.get('score', 0)),
-                    classification.get('category', ''),
-                    f"{classification.get('confidence', 0):.0%}" if classification.get('confidence') else "N/A",
+                    item['title'][:50],
+                    str(item['score'] or 0),
+                    item['category'],
+                    f"{item['confidence']:.0%}" if item['confidence'] else "N/A",
                     "Yes" if item['selftext_truncated'] else "No"
                 )
 
@@ -113,16 +119,13 @@ def digest(
             rprint("\n[dim]Run without --dry-run to generate the digest[/dim]\n")
             raise typer.Exit(0)
 
-        # Validate format
-        if format not in ['markdown', 'json', 'both']:
-            rprint(f"[red]Invalid format '{format}'. Use 'markdown', 'json', or 'both'[/red]")
-            raise typer.Exit(1)
+        format = format.value  # Validated by Typer; compare as a plain string
 
         # Generate digest
         rprint(f"\n[bold cyan]Generating digest for project '{project}'[/bold cyan]")
         rprint(f"[dim]Limit: {limit} posts | Min confidence: {min_confidence:.0%} | Format: {format}[/dim]\n")
 
-        generator = DigestGenerator(repo, project=project)
+        generator = DigestGenerator(repo, project=project, console=console)
 
         output_paths = []
 
@@ -157,8 +160,13 @@ def digest(
             rprint(f"[dim]{fmt}: {path}[/dim]")
 
         # Print paths for N8N to capture (machine-readable, no ANSI)
-        for fmt, path in output_paths:
-            print(f"{fmt}: {path}")
+        if json_paths:
+            from ..core import serialization
+
+            print(serialization.dumps({fmt: str(path) for fmt, path in output_paths}))
+        else:
+            for fmt, path in output_paths:
+                print(f"{fmt}: {path}")
 
     except typer.Exit:
         raise  # Re-raise typer.Exit without catching it
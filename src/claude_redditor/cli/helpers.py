@@ -1,14 +1,70 @@
 """CLI helper functions for output formatting and common operations."""
 
 import typer
-from rich import print as rprint
+from collections.abc import Mapping
+from functools import lru_cache
 from rich.console import Console
 from rich.table import Table
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from ..config import Settings
 
-console = Console()
+# One console for all CLI output: terminal detection happens once, and prints
+# share it with Progress/Live displays. Colors come from explicit markup, so
+# Rich's automatic repr highlighting is off.
+console = Console(highlight=False)
+rprint = console.print
+
+
+class PostDictView(Mapping):
+    """
+    Read-only dict view over a scraped Post, for CachedAnalysisEngine.
+
+    Lookups go straight to the post's attributes, so no per-post dict is
+    built just to hand posts to the cache.
+    """
+
+    __slots__ = ('_post',)
+
+    _KEYS = (
+        'id', 'title', 'selftext', 'author', 'score',
+        'num_comments', 'created_utc', 'url', 'subreddit', 'flair',
+    )
+    _KEY_SET = frozenset(_KEYS)
+
+    def __init__(self, post):
+        self._post = post
+
+    def __getitem__(self, key: str):
+        if key not in self._KEY_SET:
+            raise KeyError(key)
+        return getattr(self._post, key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+
+@lru_cache(maxsize=None)
+def get_repo(settings: Settings):
+    """
+    Get the Repository over the shared database connection pool.
+
+    One instance per settings, so commands run in the same process reuse
+    the pooled MySQL connections instead of reconnecting.
+
+    Args:
+        settings: Application settings instance
+
+    Returns:
+        Repository instance
+    """
+    from ..db.connection import get_db_connection
+    from ..db.repository import Repository
+
+    return Repository(get_db_connection(settings))
 
 
 def ensure_mysql_configured(settings: Settings) -> None:
@@ -27,6 +83,29 @@ def ensure_mysql_configured(settings: Settings) -> None:
         raise typer.Exit(1)
 
 
+def partition_classified(posts: List, classifications: List) -> Tuple[List, int, Dict[str, str]]:
+    """
+    Keep the posts that received a classification, in one pass.
+
+    The same pass collects post titles for render_classifications_with_tags.
+
+    Args:
+        posts: Scraped posts (in fetch order)
+        classifications: Classification objects returned for them
+
+    Returns:
+        (classified_posts, failed_count, titles by post ID)
+    """
+    ok_ids = {c.post_id for c in classifications}
+    classified = []
+    titles = {}
+    for post in posts:
+        titles[post.id] = post.title
+        if post.id in ok_ids:
+            classified.append(post)
+    return classified, len(posts) - len(classified), titles
+
+
 def render_cache_stats_table(cache_stats: Dict) -> Table:
     """
     Create Rich table displaying cache statistics.
@@ -42,17 +121,17 @@ def render_cache_stats_table(cache_stats: Dict) -> Table:
     Returns:
         Rich Table ready to print
     """
-    table = Table(title="💾 Cache Stats", show_header=False, box=None)
-    table.add_row("Total posts", str(cache_stats['total']))
-    table.add_row(
-        "Cached",
-        f"[green]{cache_stats['cached']}[/green] ({cache_stats['cache_hit_rate']:.1%})"
-    )
-    table.add_row("New classified", f"[cyan]{cache_stats['new']}[/cyan]")
-
+    rows = [
+        ("Total posts", str(cache_stats['total'])),
+        ("Cached", f"[green]{cache_stats['cached']}[/green] ({cache_stats['cache_hit_rate']:.1%})"),
+        ("New classified", f"[cyan]{cache_stats['new']}[/cyan]"),
+    ]
     if cache_stats.get('api_cost_saved', 0) > 0:
-        table.add_row("API cost saved", f"~${cache_stats['api_cost_saved']:.3f}")
+        rows.append(("API cost saved", f"~${cache_stats['api_cost_saved']:.3f}"))
 
+    table = Table(title="💾 Cache Stats", show_header=False, box=None)
+    for label, value in rows:
+        table.add_row(label, value)
     return table
 
 
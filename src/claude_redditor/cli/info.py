@@ -1,10 +1,10 @@
 """Info commands: config, version."""
 
 import typer
-from rich import print as rprint
 
 from ..config import settings
 from ..projects import project_loader
+from .helpers import rprint
 
 app = typer.Typer()
 
@@ -14,66 +14,71 @@ def config():
     """
     Show current configuration.
     """
-    rprint("\n[bold cyan]Current Configuration[/bold cyan]\n")
+    reddit_authenticated = settings.is_reddit_authenticated()
+    mysql_configured = settings.is_mysql_configured()
+
+    # Collect markup lines and print once: a single Rich parse/render pass
+    lines = []
+    lines.append("\n[bold cyan]Current Configuration[/bold cyan]\n")
 
     # Reddit
-    rprint("[bold]Reddit API:[/bold]")
-    if settings.is_reddit_authenticated():
-        rprint(f"  Mode: [green]PRAW (authenticated)[/green]")
-        rprint(f"  Rate Limit: 60 req/min")
+    lines.append("[bold]Reddit API:[/bold]")
+    if reddit_authenticated:
+        lines.append(f"  Mode: [green]PRAW (authenticated)[/green]")
+        lines.append(f"  Rate Limit: 60 req/min")
     else:
-        rprint(f"  Mode: [yellow]RSS (unauthenticated)[/yellow]")
-        rprint(f"  Rate Limit: 10 req/min")
-    rprint(f"  User Agent: {settings.reddit_user_agent}")
+        lines.append(f"  Mode: [yellow]RSS (unauthenticated)[/yellow]")
+        lines.append(f"  Rate Limit: 10 req/min")
+    lines.append(f"  User Agent: {settings.reddit_user_agent}")
 
     # Anthropic
-    rprint(f"\n[bold]Anthropic API:[/bold]")
+    lines.append(f"\n[bold]Anthropic API:[/bold]")
     if settings.anthropic_api_key:
-        rprint(f"  Status: [green]Configured[/green]")
-        rprint(f"  Model: {settings.anthropic_model}")
+        lines.append(f"  Status: [green]Configured[/green]")
+        lines.append(f"  Model: {settings.anthropic_model}")
     else:
-        rprint(f"  Status: [red]Not configured[/red]")
-        rprint(f"  [yellow]Set ANTHROPIC_API_KEY in .env file[/yellow]")
+        lines.append(f"  Status: [red]Not configured[/red]")
+        lines.append(f"  [yellow]Set ANTHROPIC_API_KEY in .env file[/yellow]")
 
     # Database
-    rprint(f"\n[bold]Database Cache:[/bold]")
-    if settings.is_mysql_configured():
-        rprint(f"  Status: [green]Enabled (MariaDB)[/green]")
-        rprint(f"  Host: {settings.mysql_host}:{settings.mysql_port}")
-        rprint(f"  Database: {settings.mysql_database}")
-        rprint(f"  User: {settings.mysql_user}")
+    lines.append(f"\n[bold]Database Cache:[/bold]")
+    if mysql_configured:
+        lines.append(f"  Status: [green]Enabled (MariaDB)[/green]")
+        lines.append(f"  Host: {settings.mysql_host}:{settings.mysql_port}")
+        lines.append(f"  Database: {settings.mysql_database}")
+        lines.append(f"  User: {settings.mysql_user}")
     else:
-        rprint(f"  Status: [yellow]Disabled[/yellow]")
-        rprint(f"  [dim]Set MYSQL_* variables in .env to enable[/dim]")
+        lines.append(f"  Status: [yellow]Disabled[/yellow]")
+        lines.append(f"  [dim]Set MYSQL_* variables in .env to enable[/dim]")
 
     # Projects (auto-discovered)
-    rprint(f"\n[bold]Configured Projects:[/bold]")
+    lines.append(f"\n[bold]Configured Projects:[/bold]")
     projects = project_loader.list_projects()
     if projects:
         for project_name in projects:
             proj = project_loader.load(project_name)
-            rprint(f"  [cyan]{project_name}[/cyan]: {proj.description}")
+            lines.append(f"  [cyan]{project_name}[/cyan]: {proj.description}")
             if proj.subreddits:
-                rprint(f"    Subreddits: {', '.join(f'r/{s}' for s in proj.subreddits)}")
+                lines.append(f"    Subreddits: {', '.join(f'r/{s}' for s in proj.subreddits)}")
             if proj.hn_keywords:
-                rprint(f"    HN Keywords: {', '.join(proj.hn_keywords)}")
+                lines.append(f"    HN Keywords: {', '.join(proj.hn_keywords)}")
     else:
-        rprint(f"  [yellow]No projects found[/yellow]")
-        rprint(f"  [dim]Create projects/ directory with project folders[/dim]")
+        lines.append(f"  [yellow]No projects found[/yellow]")
+        lines.append(f"  [dim]Create projects/ directory with project folders[/dim]")
 
     # Behavior
-    rprint(f"\n[bold]Behavior:[/bold]")
-    rprint(f"  Batch Size: {settings.default_batch_size} posts")
-    rprint(f"  Cache TTL: {settings.cache_ttl_hours} hours")
-    rprint(f"  Debug Mode: {'Enabled' if settings.debug else 'Disabled'}")
+    lines.append(f"\n[bold]Behavior:[/bold]")
+    lines.append(f"  Batch Size: {settings.default_batch_size} posts")
+    lines.append(f"  Cache TTL: {settings.cache_ttl_hours} hours")
+    lines.append(f"  Debug Mode: {'Enabled' if settings.debug else 'Disabled'}")
 
     # Paths
-    rprint(f"\n[bold]Output Paths:[/bold]")
-    rprint(f"  Reports: {settings.reports_dir}")
-    rprint(f"  Cache: {settings.cache_dir}")
-    rprint(f"  Classifications: {settings.classifications_dir}")
+    lines.append(f"\n[bold]Output Paths:[/bold]")
+    lines.append(f"  Output: {settings.output_dir}")
+    lines.append(f"  Reports: {settings.reports_dir}")
 
-    rprint()
+    lines.append("")
+    rprint("\n".join(lines))
 
 
 @app.command()
@@ -10,13 +10,7 @@ from datetime import date as date_type
 from pathlib import Path
 from typing import Optional
 
-import anthropic
-import httpx
 import typer
-from rich import print as rprint
-from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 from ..config import settings
 from .podcast_helpers import (
@@ -29,6 +23,7 @@ from .podcast_helpers import (
     load_podcast_config,
     load_prompt,
 )
+from .helpers import console, rprint
 
 app = typer.Typer(name="podcast", help="Podcast pipeline commands")
 logger = logging.getLogger("clauderedditor")
@@ -138,6 +133,12 @@ def edit(
 
         reddit-analyzer podcast edit --project claudeia --dry-run
     """
+    # Anthropic SDK loads only when the command runs
+    import anthropic
+    from rich.panel import Panel
+    from rich.table import Table
+    from ..classifier import get_anthropic_client
+
     date_str = date or date_type.today().isoformat()
     t0 = time.monotonic()
 
@@ -184,7 +185,7 @@ def edit(
     rprint()
 
     rprint("[cyan]Calling Claude editor...[/cyan]")
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    client = get_anthropic_client(settings.anthropic_api_key)
 
     try:
         episode, usage, msg_id = call_and_parse(
@@ -293,6 +294,12 @@ def script(
 
         reddit-analyzer podcast script --project claudeia --blocks 2,3 --force
     """
+    # Anthropic SDK loads only when the command runs
+    import anthropic
+    from rich.panel import Panel
+    from rich.table import Table
+    from ..classifier import get_anthropic_client
+
     date_str = date or date_type.today().isoformat()
     t0 = time.monotonic()
 
@@ -361,7 +368,7 @@ def script(
         rprint(f"[dim]Output:  {dialog_path} (dry run — will not be saved)[/dim]")
     rprint()
 
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    client = get_anthropic_client(settings.anthropic_api_key)
     log_file = _LOG_DIR / f"script_{date_str}.log"
 
     previous_summaries: list[str] = []
@@ -612,6 +619,10 @@ def audio(
 
         reddit-analyzer podcast audio --project claudeia --date 2026-04-27 --digest-id 01
     """
+    import httpx
+    from rich.panel import Panel
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+
     date_str = date or date_type.today().isoformat()
 
     # Load config for audio section
@@ -675,6 +686,7 @@ def audio(
             BarColumn(),
             "[progress.percentage]{task.percentage:>3.0f}%",
             TextColumn("[dim]{task.fields[info]}[/dim]"),
+            console=console,
         ) as progress:
             task_id = progress.add_task("Generating audio...", total=len(turns), info="")
 
@@ -3,16 +3,17 @@
 import json
 import time
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-import anthropic
-from anthropic.types import TextBlock, Usage
-import httpx
 import yaml
-from rich import print as rprint
+
+if TYPE_CHECKING:
+    import anthropic
+    from anthropic.types import Usage
 
 from ..config import settings
 from ..projects import project_loader
+from .helpers import rprint
 
 PRICING = {
     "claude-opus-4-7": {"input": 15.0, "output": 75.0},
@@ -122,6 +123,8 @@ _DEEPGRAM_TTS_URL = "https://api.deepgram.com/v1/speak"
 
 def call_deepgram_tts(text: str, model: str, api_key: str, speed: float = 1.0) -> bytes:
     """Call Deepgram Aura-2 TTS API and return raw MP3 bytes."""
+    import httpx
+
     response = httpx.post(
         _DEEPGRAM_TTS_URL,
         params={"model": model, "speed": speed},
@@ -152,20 +155,23 @@ def extract_ordered_turns(dialog: dict) -> list[dict]:
 
 
 def call_and_parse(
-    client: anthropic.Anthropic,
+    client: "anthropic.Anthropic",
     system_prompt: str,
     content: str,
     model: str,
     temperature: float,
     max_tokens: int,
     validate_fn: Callable[[dict], list[str]],
-) -> tuple[dict, Usage, str]:
+) -> tuple[dict, "Usage", str]:
     """Call the API, parse JSON response, validate; retry up to 3 times on any failure.
 
     validate_fn(data) → list of error strings (empty list = valid).
     Returns (parsed_dict, usage, message_id).
     Retries on: API errors, JSON parse errors, validation failures.
     """
+    import anthropic
+    from anthropic.types import TextBlock
+
     last_exc: Exception = RuntimeError("No attempts made")
     for attempt in range(1, 4):
         try:
@@ -1,27 +1,241 @@
 """Scan commands for Reddit and HackerNews."""
 
+import sys
+import threading
 import typer
-from typing import Optional, List, Tuple, Any
-from rich import print as rprint
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from ..scrapers import create_reddit_scraper, create_hn_scraper
-from ..classifier import create_classifier
-from ..analyzer import create_analyzer, create_cached_engine
-from ..reporter import create_reporter
 from ..config import settings
+from ..core.enums import OnErrorMode, ScanSource, SortMode, TimeFilter
 from ..projects import project_loader
 from .helpers import (
     console,
     render_cache_stats_table,
     handle_scan_error,
+    partition_classified,
+    PostDictView,
     render_classifications_with_tags,
+    rprint,
 )
 
 app = typer.Typer()
 
+# Options shared verbatim by scan and compare
+_PARALLEL_OPT = typer.Option(
+    settings.subreddit_concurrency,
+    "--parallel", "-p",
+    min=1,
+    help="Subreddits to fetch and classify concurrently"
+)
+
 
 # Helper Functions
 
+def _classify_pipelined(
+    batches,
+    classify,
+    progress_cb: Optional[Callable[[int], None]] = None,
+) -> Tuple[List, List]:
+    """
+    Run `classify` on each fetched batch while later batches are fetched.
+
+    Batches are classifier-sized, so up to `classifier_concurrency` of them
+    are classified at once, matching the API concurrency of a single
+    classify_posts call. `classify(batch, report)` calls `report(done)` with
+    the posts of its batch classified so far; progress_cb, if given,
+    receives the total over all batches.
+
+    Returns: (all posts, per-batch classify results), both in fetch order
+    """
+    posts = []
+    futures = []
+    done_by_batch: Dict[int, int] = {}
+    lock = threading.Lock()
+
+    def reporter(index: int) -> Callable[[int], None]:
+        def report(done: int) -> None:
+            if progress_cb is not None:
+                with lock:
+                    done_by_batch[index] = done
+                    progress_cb(sum(done_by_batch.values()))
+        return report
+
+    with ThreadPoolExecutor(max_workers=settings.classifier_concurrency, thread_name_prefix="classify") as executor:
+        for index, batch in enumerate(batches):
+            posts.extend(batch)
+            futures.append(executor.submit(classify, batch, reporter(index)))
+        return posts, [future.result() for future in futures]
+
+
+def _flush_cache_writes() -> None:
+    """Wait for background cache writes; failures are reported, not raised."""
+    from ..analyzer import create_cached_engine
+
+    try:
+        create_cached_engine(settings).flush()
+    except Exception as e:
+        rprint(f"[yellow]⚠ Could not save new classifications to the cache: {e}[/yellow]\n")
+
+
+def _save_scan_history(history: List[tuple], project: str) -> None:
+    """Write the queued scan-history rows; errors are reported, not raised."""
+    if not history:
+        return
+
+    from ..analyzer import create_cached_engine
+
+    try:
+        create_cached_engine(settings).save_scan_results(history, project=project)
+    except Exception as e:
+        rprint(f"[yellow]⚠ Could not save scan history: {e}[/yellow]\n")
+
+
+def _merge_cache_stats(batch_stats: List[dict]) -> dict:
+    """Combine per-batch cache stats into totals for the whole source."""
+    if len(batch_stats) == 1:
+        return batch_stats[0]
+
+    total = sum(stats['total'] for stats in batch_stats)
+    cached = sum(stats['cached'] for stats in batch_stats)
+    merged = {
+        'total': total,
+        'cached': cached,
+        'new': sum(stats['new'] for stats in batch_stats),
+        'cache_hit_rate': cached / total if total else 0.0,
+    }
+    if any('api_cost_saved' in stats for stats in batch_stats):
+        merged['api_cost_saved'] = sum(stats.get('api_cost_saved', 0.0) for stats in batch_stats)
+    return merged
+
+
+def _classify_progress():
+    """Transient classification progress bars on the shared CLI console."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+        transient=True,
+    )
+
+
+def _continue_after_error(on_error: str, progress: Optional[Any] = None) -> bool:
+    """
+    Decide whether to go on to the next source after one failed.
+
+    "ask" prompts only when stdin is a terminal; cron/N8N runs continue.
+    A running ``progress`` display is stopped while prompting, otherwise its
+    refreshes would draw over the prompt line.
+    """
+    if on_error == "abort":
+        return False
+    if on_error == "ask" and sys.stdin.isatty():
+        if progress is not None:
+            progress.stop()
+        try:
+            return typer.confirm("Continue with next source?", default=True)
+        finally:
+            if progress is not None:
+                progress.start()
+    return True
+
+
+def _collect_reddit_source(
+    subreddit: str,
+    limit: int,
+    sort: str,
+    time_filter: str,
+    project: str,
+    no_cache: bool,
+    history: List[tuple],
+    progress_cb: Optional[Callable[[int], None]] = None,
+) -> Optional[dict]:
+    """
+    Fetch, classify and analyze a single subreddit without printing.
+
+    Safe to run on a worker thread; rendering is left to the caller so
+    concurrent subreddits never interleave their terminal output.
+    When the cache is used, the scan-history row is appended to `history`
+    for the caller to save in one batch.
+    progress_cb, if given, receives the number of posts classified so far.
+
+    Returns: dict with posts, classifications, report, cache_stats and
+    whether the cache was used, or None if no posts were found
+    """
+    # Heavy modules (Anthropic SDK, PRAW, SQLAlchemy) load only when scanning
+    from ..scrapers import create_reddit_scraper
+    from ..classifier import create_classifier
+    from ..analyzer import create_analyzer, create_cached_engine
+
+    cached_engine = create_cached_engine(settings)
+    use_cache = not no_cache and settings.is_mysql_configured()
+
+    def classify(batch, report):
+        def report_progress(done: int, total: int) -> None:
+            report(done)
+
+        # Classify (with or without cache)
+        if not use_cache:
+            classifications = create_classifier().classify_posts(
+                batch, project=project, progress_cb=report_progress, use_memo=not no_cache,
+            )
+            result = classifications, {'total': len(batch), 'cached': 0, 'new': len(classifications), 'cache_hit_rate': 0.0}
+        else:
+            # The cache engine reads posts as mappings (views avoid copying them)
+            # and only builds the classifier if some posts miss the cache
+            result = cached_engine.analyze_with_cache(
+                [PostDictView(p) for p in batch], create_classifier,
+                source='reddit', project=project, progress_cb=report_progress,
+            )
+        report(len(batch))
+        return result
+
+    # Scrape, classifying batches of posts while the next ones download
+    scraper = create_reddit_scraper()
+    posts, results = _classify_pipelined(
+        scraper.iter_post_batches(subreddit, limit=limit, time_filter=time_filter, sort=sort),
+        classify,
+        progress_cb,
+    )
+
+    if not posts:
+        return None
+
+    classifications = [c for batch_classifications, _ in results for c in batch_classifications]
+    cache_stats = _merge_cache_stats([stats for _, stats in results])
+
+    # Filter successfully classified posts
+    filtered_posts, failed, titles = partition_classified(posts, classifications)
+
+    # Analyze
+    analyzer = create_analyzer()
+    report = analyzer.analyze(
+        posts=filtered_posts,
+        classifications=classifications,
+        subreddit=subreddit,
+        period=f"{limit} {sort} posts ({time_filter if sort == 'top' else 'recent'})",
+    )
+
+    # Queue scan history if cache is enabled (saved in one batch by scan())
+    if use_cache:
+        history.append((subreddit, cache_stats, report.signal_ratio, 'reddit'))
+
+    return {
+        'posts': posts,
+        'filtered_posts': filtered_posts,
+        'failed': failed,
+        'titles': titles,
+        'classifications': classifications,
+        'report': report,
+        'cache_stats': cache_stats,
+        'use_cache': use_cache,
+    }
+
+
 def _scan_reddit_source(
     subreddit: str,
     limit: int,
@@ -31,90 +245,54 @@ def _scan_reddit_source(
     no_cache: bool,
     no_details: bool,
     export_json: bool,
+    pending: Future,
+    on_error: str = "continue",
+    progress: Optional[Any] = None,
 ) -> Tuple[Optional[Any], Optional[Any], Optional[Any], Optional[dict]]:
     """
-    Scan a single Reddit subreddit source.
+    Render a single Reddit subreddit source.
+
+    ``pending`` is a future for ``_collect_reddit_source`` already running on
+    a worker thread; only its result is rendered here. ``progress`` is the
+    live display the caller renders under, paused if --on-error ask has to
+    prompt.
 
     Returns: (posts, classifications, report, cache_stats) or (None, None, None, None) on failure
     """
+    from ..reporter import create_reporter
+
     rprint(f"[bold cyan]Analyzing r/{subreddit}[/bold cyan]")
     rprint(f"[dim]Fetching {limit} {sort} posts...[/dim]\n")
 
     try:
-        # Scrape
-        scraper = create_reddit_scraper()
-        posts = scraper.fetch_posts(subreddit, limit=limit, sort=sort, time_filter=time_filter)
+        result = pending.result()
 
-        if not posts:
+        if result is None:
             rprint(f"[yellow]⚠ No posts found for r/{subreddit}[/yellow]\n")
             return None, None, None, None
 
-        rprint(f"[green]✓[/green] Fetched {len(posts)} posts")
-
-        # Classify (with or without cache)
-        classifier = create_classifier()
-        cached_engine = create_cached_engine(settings)
+        posts = result['posts']
+        classifications = result['classifications']
+        report = result['report']
+        cache_stats = result['cache_stats']
 
-        # Convert posts to dicts for compatibility
-        posts_dicts = [
-            {
-                'id': p.id,
-                'title': p.title,
-                'selftext': p.selftext,
-                'author': p.author,
-                'score': p.score,
-                'num_comments': p.num_comments,
-                'created_utc': p.created_utc,
-                'url': p.url,
-                'subreddit': p.subreddit,
-            }
-            for p in posts
-        ]
-
-        if no_cache or not settings.is_mysql_configured():
-            if no_cache:
-                rprint(f"[yellow]Cache bypassed[/yellow]")
-            rprint(f"[dim]Classifying {len(posts)} posts with Claude...[/dim]")
-            classifications = classifier.classify_posts(posts, project=project)
-            cache_stats = {'total': len(posts), 'cached': 0, 'new': len(classifications), 'cache_hit_rate': 0.0}
-        else:
-            rprint(f"[dim]Checking cache and classifying new posts...[/dim]")
-            classifications, cache_stats = cached_engine.analyze_with_cache(
-                posts_dicts, classifier, source='reddit', project=project
-            )
+        rprint(f"[green]✓[/green] Fetched {len(posts)} posts")
 
+        if result['use_cache']:
             # Show cache stats
             console.print(render_cache_stats_table(cache_stats))
             rprint()
+        elif no_cache:
+            rprint(f"[yellow]Cache bypassed[/yellow]")
 
-        # Filter successfully classified posts
-        classified_post_ids = {c.post_id for c in classifications}
-        filtered_posts = [p for p in posts if p.id in classified_post_ids]
-
-        if len(filtered_posts) != len(posts):
-            rprint(f"[yellow]⚠ {len(posts) - len(filtered_posts)} posts failed classification[/yellow]")
+        if result['failed']:
+            rprint(f"[yellow]⚠ {result['failed']} posts failed classification[/yellow]")
 
         # Show classifications with tags
-        posts_dict = {p.id: p.title for p in posts}
-        render_classifications_with_tags(classifications, posts_dict)
-
-        # Analyze
-        analyzer = create_analyzer()
-        report = analyzer.analyze(
-            posts=filtered_posts,
-            classifications=classifications,
-            subreddit=subreddit,
-            period=f"{limit} {sort} posts ({time_filter if sort == 'top' else 'recent'})",
-        )
-
-        # Save scan history if cache is enabled
-        if not no_cache and settings.is_mysql_configured():
-            cached_engine.save_scan_result(
-                subreddit, cache_stats, report.signal_ratio, source='reddit', project=project
-            )
+        render_classifications_with_tags(classifications, result['titles'])
 
         # Report
-        reporter = create_reporter()
+        reporter = create_reporter(console)
         rprint()  # Blank line before report
         reporter.render_terminal(report, show_details=not no_details)
 
@@ -127,6 +305,8 @@ def _scan_reddit_source(
 
     except Exception as e:
         rprint(f"[red]✗ Error analyzing r/{subreddit}: {e}[/red]\n")
+        if not _continue_after_error(on_error, progress):
+            raise typer.Exit(1)
         return None, None, None, None
 
 
@@ -138,12 +318,21 @@ def _scan_hackernews_source(
     no_cache: bool,
     no_details: bool,
     export_json: bool,
+    history: List[tuple],
+    on_error: str = "continue",
 ) -> Tuple[Optional[Any], Optional[Any], Optional[Any], Optional[dict]]:
     """
     Scan HackerNews with keywords.
 
+    The scan-history row is appended to `history` (saved in one batch by scan()).
+
     Returns: (posts, classifications, report, cache_stats) or (None, None, None, None) on failure
     """
+    from ..scrapers import create_hn_scraper
+    from ..classifier import create_classifier
+    from ..analyzer import create_analyzer, create_cached_engine
+    from ..reporter import create_reporter
+
     rprint(f"[bold cyan]Analyzing HackerNews[/bold cyan]")
     rprint(f"[dim]Keywords: {', '.join(keywords)} | Limit: {limit} | Sort: {sort}[/dim]\n")
 
@@ -159,38 +348,39 @@ def _scan_hackernews_source(
         rprint(f"[green]✓[/green] Fetched {len(posts)} posts")
 
         # Classify (with or without cache)
-        classifier = create_classifier()
         cached_engine = create_cached_engine(settings)
 
-        # Convert posts to dicts for compatibility
-        posts_dicts = [p.to_dict() for p in posts]
-
-        if no_cache or not settings.is_mysql_configured():
+        mysql_configured = settings.is_mysql_configured()
+        if no_cache or not mysql_configured:
             if no_cache:
                 rprint(f"[yellow]Cache bypassed[/yellow]")
-            rprint(f"[dim]Classifying {len(posts)} posts with Claude...[/dim]")
-            classifications = classifier.classify_posts(posts, project=project)
+            with _classify_progress() as progress:
+                task = progress.add_task(f"Classifying {len(posts)} posts with Claude", total=len(posts))
+                classifications = create_classifier().classify_posts(
+                    posts, project=project, use_memo=not no_cache,
+                    progress_cb=lambda done, total: progress.update(task, completed=done, total=total),
+                )
             cache_stats = {'total': len(posts), 'cached': 0, 'new': len(classifications), 'cache_hit_rate': 0.0}
         else:
-            rprint(f"[dim]Checking cache and classifying new posts...[/dim]")
-            classifications, cache_stats = cached_engine.analyze_with_cache(
-                posts_dicts, classifier, source='hackernews', project=project
-            )
+            with _classify_progress() as progress:
+                task = progress.add_task("Checking cache and classifying new posts", total=None)
+                classifications, cache_stats = cached_engine.analyze_with_cache(
+                    [PostDictView(p) for p in posts], create_classifier, source='hackernews', project=project,
+                    progress_cb=lambda done, total: progress.update(task, completed=done, total=total),
+                )
 
             # Show cache stats
             console.print(render_cache_stats_table(cache_stats))
             rprint()
 
         # Filter successfully classified posts
-        classified_post_ids = {c.post_id for c in classifications}
-        filtered_posts = [p for p in posts if p.id in classified_post_ids]
+        filtered_posts, failed, titles = partition_classified(posts, classifications)
 
-        if len(filtered_posts) != len(posts):
-            rprint(f"[yellow]⚠ {len(posts) - len(filtered_posts)} posts failed classification[/yellow]")
+        if failed:
+            rprint(f"[yellow]⚠ {failed} posts failed classification[/yellow]")
 
         # Show classifications with tags
-        posts_dict = {p.id: p.title for p in posts}
-        render_classifications_with_tags(classifications, posts_dict)
+        render_classifications_with_tags(classifications, titles)
 
         # Analyze
         analyzer = create_analyzer()
@@ -201,20 +391,12 @@ def _scan_hackernews_source(
             period=f"{limit} {sort} posts (keywords: {', '.join(keywords)})",
         )
 
-        # Save scan history if cache is enabled
-        if settings.is_mysql_configured() and hasattr(cached_engine, 'repo'):
-            cached_engine.repo.save_scan_history(
-                subreddit="HackerNews",
-                posts_fetched=len(posts),
-                posts_classified=cache_stats['new'],
-                posts_cached=cache_stats['cached'],
-                signal_ratio=report.signal_ratio * 100,
-                source='hackernews',
-                project=project
-            )
+        # Queue scan history if the database is configured
+        if mysql_configured:
+            history.append(("HackerNews", cache_stats, report.signal_ratio, 'hackernews'))
 
         # Report
-        reporter = create_reporter()
+        reporter = create_reporter(console)
         rprint()  # Blank line before report
         reporter.render_terminal(report, show_details=not no_details)
 
@@ -227,9 +409,58 @@ def _scan_hackernews_source(
 
     except Exception as e:
         rprint(f"[red]✗ Error scanning HackerNews: {e}[/red]\n")
+        if not _continue_after_error(on_error):
+            raise typer.Exit(1)
         return None, None, None, None
 
 
+def _compare_subreddit(
+    sub: str,
+    limit: int,
+    sort: str,
+    project: str,
+    progress_cb: Optional[Callable[[int], None]] = None,
+) -> Optional[Any]:
+    """
+    Fetch, classify and analyze one subreddit for `compare` (no cache, no output).
+
+    progress_cb, if given, receives the number of posts classified so far.
+
+    Returns: AnalysisReport, or None if no posts were found
+    """
+    from ..scrapers import create_reddit_scraper
+    from ..classifier import create_classifier
+    from ..analyzer import create_analyzer
+
+    # Scrape and classify, overlapping page fetches with classification
+    scraper = create_reddit_scraper()
+    classifier = create_classifier()
+
+    def classify(batch, report):
+        return classifier.classify_posts(
+            batch, project=project, progress_cb=lambda done, total: report(done),
+        )
+
+    posts, results = _classify_pipelined(scraper.iter_post_batches(sub, limit=limit, sort=sort), classify, progress_cb)
+
+    if not posts:
+        return None
+
+    classifications = [c for batch_classifications in results for c in batch_classifications]
+
+    # Filter
+    filtered_posts, _, _ = partition_classified(posts, classifications)
+
+    # Analyze
+    analyzer = create_analyzer()
+    return analyzer.analyze(
+        posts=filtered_posts,
+        classifications=classifications,
+        subreddit=sub,
+        period=f"{limit} {sort} posts",
+    )
+
+
 # Commands
 
 @app.command()
@@ -238,8 +469,8 @@ def scan(
         ...,
         help="Project name (e.g., 'claudeia', 'wineworld')"
     ),
-    source: str = typer.Option(
-        "all",
+    source: ScanSource = typer.Option(
+        ScanSource.ALL,
         "--source", "-s",
         help="Source to scan: all, reddit, hackernews"
     ),
@@ -248,13 +479,13 @@ def scan(
         "--limit", "-l",
         help="Number of posts per source"
     ),
-    sort: str = typer.Option(
-        "hot",
+    sort: SortMode = typer.Option(
+        SortMode.HOT,
         "--sort",
         help="Sort method: hot, new, top, rising"
     ),
-    time_filter: str = typer.Option(
-        "week",
+    time_filter: TimeFilter = typer.Option(
+        TimeFilter.WEEK,
         "--time-filter", "-t",
         help="Time filter for 'top' sort: hour, day, week, month, year, all"
     ),
@@ -273,6 +504,12 @@ def scan(
         "--no-cache",
         help="Bypass database cache (classify all posts)"
     ),
+    parallel: int = _PARALLEL_OPT,
+    on_error: OnErrorMode = typer.Option(
+        OnErrorMode.CONTINUE,
+        "--on-error",
+        help="When a source fails: continue, abort, or ask (prompts only on a TTY)"
+    ),
 ):
     """
     Scan and analyze posts from configured sources for a project.
@@ -294,11 +531,8 @@ def scan(
         # Export results to JSON
         reddit-analyzer scan claudeia --export-json
     """
-    # Validate source parameter
-    valid_sources = ["all", "reddit", "hackernews"]
-    if source not in valid_sources:
-        rprint(f"[red]✗ Invalid source '{source}'. Must be: {', '.join(valid_sources)}[/red]")
-        raise typer.Exit(1)
+    # Choices were validated by Typer; downstream code works with plain strings
+    source, sort, time_filter, on_error = source.value, sort.value, time_filter.value, on_error.value
 
     # Load project configuration
     try:
@@ -315,8 +549,10 @@ def scan(
         raise typer.Exit(1)
 
     # Validate source configuration
-    has_reddit = proj.subreddits and len(proj.subreddits) > 0
-    has_hn = proj.hn_keywords and len(proj.hn_keywords) > 0
+    subreddits = proj.subreddits or []
+    hn_keywords = proj.hn_keywords or []
+    has_reddit = bool(subreddits)
+    has_hn = bool(hn_keywords)
 
     if source == "reddit" and not has_reddit:
         rprint(f"[red]✗ No subreddits configured for project '{project}'[/red]")
@@ -341,46 +577,79 @@ def scan(
             rprint(f"[yellow]⚠ Project '{project}' has no HackerNews keywords configured. Scanning Reddit only.[/yellow]\n")
         else:
             rprint(f"\n[cyan]Scanning all sources for project '{project}':[/cyan]")
-            rprint(f"[dim]Reddit: {', '.join(f'r/{s}' for s in proj.subreddits)}[/dim]")
-            rprint(f"[dim]HackerNews: {', '.join(proj.hn_keywords)}[/dim]\n")
+            rprint(f"[dim]Reddit: {', '.join(f'r/{s}' for s in subreddits)}[/dim]")
+            rprint(f"[dim]HackerNews: {', '.join(hn_keywords)}[/dim]\n")
 
     # Scan sources
     reports = []
+    history = []  # Scan-history rows, written in one INSERT at the end
 
-    # Scan Reddit subreddits
-    if source in ["all", "reddit"] and has_reddit:
-        for sub in proj.subreddits:
-            _, _, report, _ = _scan_reddit_source(
-                subreddit=sub,
+    # History rows are saved even if the run ends early (--on-error abort,
+    # an uncaught error or Ctrl-C), so finished sources are not lost
+    try:
+        # Scan Reddit subreddits
+        if source in ["all", "reddit"] and has_reddit:
+            # Subreddits are fetched and classified concurrently but rendered
+            # in config order, so the output reads the same as a serial run
+            workers = min(parallel, len(subreddits))
+            with _classify_progress() as progress, \
+                    ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as executor:
+                tasks = [progress.add_task(f"r/{sub}", total=limit) for sub in subreddits]
+                pending = [
+                    executor.submit(
+                        _collect_reddit_source, sub, limit, sort, time_filter, project, no_cache, history,
+                        lambda done, task=task: progress.update(task, completed=done),
+                    )
+                    for sub, task in zip(subreddits, tasks)
+                ]
+                try:
+                    for sub, task, future in zip(subreddits, tasks, pending):
+                        _, _, report, _ = _scan_reddit_source(
+                            subreddit=sub,
+                            limit=limit,
+                            sort=sort,
+                            time_filter=time_filter,
+                            project=project,
+                            no_cache=no_cache,
+                            no_details=no_details,
+                            export_json=export_json,
+                            pending=future,
+                            on_error=on_error,
+                            progress=progress,
+                        )
+                        progress.remove_task(task)
+                        if report:
+                            reports.append(report)
+                except typer.Exit:
+                    # Aborting: drop subreddits that have not started yet
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+        # Scan HackerNews
+        if source in ["all", "hackernews"] and has_hn:
+            _, _, report, _ = _scan_hackernews_source(
+                keywords=hn_keywords,
                 limit=limit,
-                sort=sort,
-                time_filter=time_filter,
+                sort="top",  # HN always uses "top" sort
                 project=project,
                 no_cache=no_cache,
                 no_details=no_details,
                 export_json=export_json,
+                history=history,
+                on_error=on_error,
             )
             if report:
                 reports.append(report)
-
-    # Scan HackerNews
-    if source in ["all", "hackernews"] and has_hn:
-        _, _, report, _ = _scan_hackernews_source(
-            keywords=proj.hn_keywords,
-            limit=limit,
-            sort="top",  # HN always uses "top" sort
-            project=project,
-            no_cache=no_cache,
-            no_details=no_details,
-            export_json=export_json,
-        )
-        if report:
-            reports.append(report)
+    finally:
+        _flush_cache_writes()
+        _save_scan_history(history, project)
 
     # Show comparison if multiple sources
     if len(reports) > 1:
+        from ..reporter import create_reporter
+
         rprint("\n[bold cyan]Source Comparison[/bold cyan]\n")
-        reporter = create_reporter()
+        reporter = create_reporter(console)
         reporter.render_comparison(reports)
 
     if reports:
@@ -400,8 +669,8 @@ def compare(
         "--limit", "-l",
         help="Number of posts to analyze per subreddit"
     ),
-    sort: str = typer.Option(
-        "hot",
+    sort: SortMode = typer.Option(
+        SortMode.HOT,
         "--sort", "-s",
         help="Sort method: hot, new, top, rising"
     ),
@@ -410,6 +679,7 @@ def compare(
         "--export-json",
         help="Export reports to JSON files"
     ),
+    parallel: int = _PARALLEL_OPT,
 ):
     """
     Compare signal/noise ratio across all configured subreddits for a project.
@@ -424,6 +694,10 @@ def compare(
 
         reddit-analyzer compare claudeia --limit 30 --sort top
     """
+    from ..reporter import create_reporter
+
+    sort = sort.value
+
     # Load project configuration
     try:
         proj = project_loader.load(project)
@@ -448,55 +722,55 @@ def compare(
     rprint(f"[dim]Analyzing {limit} {sort} posts from each...[/dim]\n")
 
     reports = []
+    reporter = create_reporter(console)
+
+    workers = min(parallel, len(subreddits))
+    with _classify_progress() as progress, \
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="compare") as executor:
+        tasks = [progress.add_task(f"r/{sub}", total=limit) for sub in subreddits]
+        pending = [
+            executor.submit(
+                _compare_subreddit, sub, limit, sort, project,
+                lambda done, task=task: progress.update(task, completed=done),
+            )
+            for sub, task in zip(subreddits, tasks)
+        ]
 
-    for sub in subreddits:
-        rprint(f"[cyan]Processing r/{sub}...[/cyan]")
+        for sub, task, future in zip(subreddits, tasks, pending):
+            rprint(f"[cyan]Processing r/{sub}...[/cyan]")
 
-        try:
-            # Scrape
-            scraper = create_reddit_scraper()
-            posts = scraper.fetch_posts(sub, limit=limit, sort=sort)
+            try:
+                report = future.result()
 
-            if not posts:
-                rprint(f"[yellow]⚠ No posts found, skipping[/yellow]\n")
-                continue
+                if report is None:
+                    rprint(f"[yellow]⚠ No posts found, skipping[/yellow]\n")
+                    continue
 
-            # Classify
-            classifier = create_classifier()
-            classifications = classifier.classify_posts(posts, project=project)
-
-            # Filter
-            classified_post_ids = {c.post_id for c in classifications}
-            filtered_posts = [p for p in posts if p.id in classified_post_ids]
-
-            # Analyze
-            analyzer = create_analyzer()
-            report = analyzer.analyze(
-                posts=filtered_posts,
-                classifications=classifications,
-                subreddit=sub,
-                period=f"{limit} {sort} posts",
-            )
+                reports.append(report)
+                rprint(f"[green]✓[/green] r/{sub} complete (Signal: {report.signal_ratio:.1%})\n")
 
-            reports.append(report)
-            rprint(f"[green]✓[/green] r/{sub} complete (Signal: {report.signal_ratio:.1%})\n")
+                # Export if requested
+                if export_json:
+                    json_path = reporter.export_json(report)
+                    rprint(f"[dim]Exported to: {json_path}[/dim]\n")
 
-            # Export if requested
-            if export_json:
-                reporter = create_reporter()
-                json_path = reporter.export_json(report)
-                rprint(f"[dim]Exported to: {json_path}[/dim]\n")
+            except Exception as e:
+                rprint(f"[red]✗ Error: {e}[/red]\n")
+                continue
 
-        except Exception as e:
-            rprint(f"[red]✗ Error: {e}[/red]\n")
-            continue
+            finally:
+                progress.remove_task(task)
 
     # Show comparison
-    if reports:
+    if len(reports) > 1:
         rprint()
-        reporter = create_reporter()
         reporter.render_comparison(reports)
         rprint(f"\n[bold green]✓ Comparison complete![/bold green]\n")
+    elif reports:
+        # Nothing to compare against: show the lone report in full instead
+        rprint()
+        reporter.render_terminal(reports[0])
+        rprint(f"\n[bold green]✓ Analysis complete![/bold green]\n")
     else:
         rprint("[red]✗ No reports generated[/red]")
         raise typer.Exit(1)
@@ -24,6 +24,7 @@ class Settings(BaseSettings):
     # Anthropic API
     anthropic_api_key: str = ""
     anthropic_model: str = "claude-haiku-4-5-20251001"
+    anthropic_max_retries: int = 4  # SDK retries for 429/5xx (exp. backoff + jitter, honors Retry-After)
 
     # Deepgram TTS (required for podcast audio)
     deepgram_api_key: str = ""
@@ -43,6 +44,9 @@ class Settings(BaseSettings):
 
     # Behavior
     default_batch_size: int = 20  # Posts per Claude API request
+    max_concurrent_api: int = 8  # Parallel Claude API requests (digest generation)
+    classifier_concurrency: int = 4  # Parallel classification batches per scan
+    subreddit_concurrency: int = 2  # Subreddits scanned at once (default for --parallel)
     cache_ttl_hours: int = 24
     max_lines_article: int = 5000  # Max selftext for SIGNAL/META posts
     max_selftext_noise: int = 500  # Max selftext for NOISE/UNRELATED posts
@@ -58,6 +62,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,  # Read-only after load; also makes the instance hashable
     )
 
     def is_reddit_authenticated(self) -> bool:
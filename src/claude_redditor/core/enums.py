@@ -1,7 +1,7 @@
-"""Enumerations and constants for post classification."""
+"""Enumerations and constants for post classification and CLI option choices."""
 
 from enum import Enum
-from typing import List
+from typing import Dict, List, Mapping
 
 
 class CategoryEnum(str, Enum):
@@ -40,7 +40,7 @@ class CategoryEnum(str, Enum):
     @classmethod
     def is_signal(cls, category: "CategoryEnum") -> bool:
         """Check if a category is signal."""
-        return category in cls.signal_categories()
+        return category in SIGNAL_CATEGORIES
 
     @classmethod
     def is_low_value(cls, category: "CategoryEnum") -> bool:
@@ -48,10 +48,43 @@ class CategoryEnum(str, Enum):
         Check if category is NOISE or UNRELATED (low-value content).
         Used to determine selftext truncation (500 chars vs 5000 chars).
         """
-        return category in [
-            cls.MYSTICAL, cls.UNVERIFIED_CLAIM, cls.ENGAGEMENT_BAIT,  # NOISE
-            cls.UNRELATED  # Off-topic
-        ]
+        return category in LOW_VALUE_CATEGORIES
+
+
+# Category groups as frozensets for O(1) membership checks in hot loops.
+# CategoryEnum is a str Enum, so plain string values ("technical") match too.
+SIGNAL_CATEGORIES = frozenset(CategoryEnum.signal_categories())
+NOISE_CATEGORIES = frozenset(CategoryEnum.noise_categories())
+LOW_VALUE_CATEGORIES = NOISE_CATEGORIES | {CategoryEnum.UNRELATED}
+META_CATEGORIES = frozenset([CategoryEnum.COMMUNITY, CategoryEnum.MEME])
+
+# Category -> group ("signal", "noise", "meta", "other", "unrelated"), built once
+CATEGORY_KIND: Dict[CategoryEnum, str] = {
+    cat: (
+        "signal" if cat in SIGNAL_CATEGORIES
+        else "noise" if cat in NOISE_CATEGORIES
+        else "meta" if cat in META_CATEGORIES
+        else "unrelated" if cat == CategoryEnum.UNRELATED
+        else "other"
+    )
+    for cat in CategoryEnum
+}
+
+
+def count_by_kind(category_counts: Mapping[str, int]) -> Dict[str, int]:
+    """
+    Sum category counts per group in a single sweep.
+
+    Args:
+        category_counts: Counts keyed by CategoryEnum or its string value
+
+    Returns:
+        Dict with a count for every group in CATEGORY_KIND (unknown keys go to "other")
+    """
+    totals = dict.fromkeys(("signal", "noise", "meta", "other", "unrelated"), 0)
+    for cat, count in category_counts.items():
+        totals[CATEGORY_KIND.get(cat, "other")] += count
+    return totals
 
 
 # Red flag detection patterns
@@ -100,3 +133,50 @@ RED_FLAG_PATTERNS = {
 # Regex pattern for precise numbers without sources
 # Matches patterns like "95.7 times", "2,725 emojis", "14.3% more"
 PRECISE_NUMBER_PATTERN = r'\b\d+[.,]\d+\s+(times|%|percent|emojis|tokens|words|increase|decrease|more|less)\b'
+
+
+# CLI option choices. Typer validates these while parsing arguments (and offers
+# them to shell completion); commands pass .value on to scrapers and reporters.
+
+class ScanSource(str, Enum):
+    """Sources a scan can cover."""
+
+    ALL = "all"
+    REDDIT = "reddit"
+    HACKERNEWS = "hackernews"
+
+
+class SortMode(str, Enum):
+    """Listing sort for fetched posts."""
+
+    HOT = "hot"
+    NEW = "new"
+    TOP = "top"
+    RISING = "rising"
+
+
+class TimeFilter(str, Enum):
+    """Time window for the 'top' sort."""
+
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+    ALL = "all"
+
+
+class OnErrorMode(str, Enum):
+    """What a multi-source scan does when one source fails."""
+
+    CONTINUE = "continue"
+    ABORT = "abort"
+    ASK = "ask"
+
+
+class DigestFormat(str, Enum):
+    """Digest output formats."""
+
+    MARKDOWN = "markdown"
+    JSON = "json"
+    BOTH = "both"
@@ -1,13 +1,13 @@
 """Data models for the Reddit analyzer."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Counter, Dict, List, Optional
 from datetime import datetime
 
 from .enums import CategoryEnum
 
 
-@dataclass
+@dataclass(slots=True)
 class RedditPost:
     """Represents a Reddit post with relevant metadata."""
 
@@ -50,7 +50,7 @@ class RedditPost:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Classification:
     """Classification result for a Reddit post."""
 
@@ -82,9 +82,9 @@ class Classification:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PostSummary:
-    """Condensed post information for reports."""
+    """Condensed post information for reports (immutable, slotted)."""
 
     id: str
     title: str
@@ -114,12 +114,15 @@ class AnalysisReport:
     subreddit: str
     period: str
     total_posts: int
-    category_counts: Dict[CategoryEnum, int]
+    category_counts: Counter[CategoryEnum]
     signal_ratio: float
-    red_flags_distribution: Dict[str, int]
+    red_flags_distribution: Counter[str]
     top_signal: List[PostSummary] = field(default_factory=list)
     top_noise: List[PostSummary] = field(default_factory=list)
     unrelated_count: int = 0  # Posts filtered as off-topic
+    signal_count: int = 0  # Per-kind totals of category_counts (see count_by_kind)
+    noise_count: int = 0
+    meta_count: int = 0
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -0,0 +1,37 @@
+"""JSON helpers that use orjson when installed, falling back to the stdlib."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson  # Optional: 2-5x faster parsing/serialization
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Raises:
+        json.JSONDecodeError: On invalid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize obj to a JSON string (non-ASCII characters kept as-is).
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation (default: compact,
+            no whitespace between tokens)
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
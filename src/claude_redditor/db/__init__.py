@@ -1,11 +1,12 @@
 """Database layer for Reddit Analyzer."""
 
-from .connection import DatabaseConnection
+from .connection import DatabaseConnection, get_db_connection
 from .models import RedditPost, Classification, ScanHistory
 from .repository import Repository
 
 __all__ = [
     "DatabaseConnection",
+    "get_db_connection",
     "RedditPost",
     "Classification",
     "ScanHistory",
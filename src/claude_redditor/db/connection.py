@@ -4,6 +4,7 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Generator
 import logging
 
@@ -96,3 +97,16 @@ class DatabaseConnection:
         except Exception as e:
             logger.error(f"Database connection test FAILED: {e}")
             return False
+
+
+@lru_cache(maxsize=None)
+def get_db_connection(config) -> DatabaseConnection:
+    """
+    Get the shared DatabaseConnection for these settings.
+
+    One engine (and so one connection pool) per process: commands and the
+    parallel scan workers reuse pooled connections instead of opening a new
+    pool, and a new TCP/auth handshake, on every call. Settings are frozen,
+    so they work as the cache key.
+    """
+    return DatabaseConnection(config)
@@ -37,25 +37,22 @@ class Repository:
             project: Project name (default: 'default')
 
         Returns:
-            List of dicts with classification + post data
+            List of classification dicts
         """
         if not post_ids:
             return []
 
+        # Only the classification rows are needed to skip re-classifying, so
+        # no JOIN against posts (the FK already guarantees the row) on the hot path
         with self.db.get_session() as session:
-            results = session.execute(
-                select(Classification, RedditPost)
-                .join(RedditPost, Classification.post_id == RedditPost.id)
+            results = session.scalars(
+                select(Classification)
                 .where(Classification.post_id.in_(post_ids))
                 .where(Classification.source == source)
                 .where(Classification.project == project)
             ).all()
 
-            cached = []
-            for classification, post in results:
-                data = classification.to_dict()
-                data['post'] = post.to_dict()
-                cached.append(data)
+            cached = [classification.to_dict() for classification in results]
 
             logger.info(f"Cache hit: {len(cached)}/{len(post_ids)} posts (source: {source})")
             return cached
@@ -198,6 +195,22 @@ class Repository:
             session.add(scan)
             logger.info(f"Scan history saved: {subreddit} (source: {source}, project: {project})")
 
+    def save_scan_history_batch(self, rows: List[Dict]) -> None:
+        """
+        Save several scans to history with one executemany INSERT.
+
+        Args:
+            rows: Dicts with the save_scan_history() fields (subreddit,
+                posts_fetched, posts_classified, posts_cached, signal_ratio,
+                source, project)
+        """
+        if not rows:
+            return
+
+        with self.db.get_session() as session:
+            session.execute(insert(ScanHistory), rows)
+            logger.info(f"Scan history saved for {len(rows)} sources")
+
     def get_scan_history(
         self,
         subreddit: Optional[str] = None,
@@ -277,6 +290,29 @@ class Repository:
             count = session.execute(query).scalar()
             return count or 0
 
+    def get_cache_summary(self, project: Optional[str] = None) -> Dict[str, int]:
+        """
+        Get post and classification totals in one round trip.
+
+        Returns:
+            Dict with 'posts' and 'classifications' counts
+        """
+        posts_query = select(func.count(RedditPost.id))
+        classifications_query = select(func.count(Classification.id))
+
+        if project:
+            posts_query = posts_query.where(RedditPost.project == project)
+            classifications_query = classifications_query.where(Classification.project == project)
+
+        with self.db.get_session() as session:
+            row = session.execute(
+                select(
+                    posts_query.scalar_subquery().label('posts'),
+                    classifications_query.scalar_subquery().label('classifications'),
+                )
+            ).one()
+            return {'posts': row.posts or 0, 'classifications': row.classifications or 0}
+
     # ============ DIGEST ============
 
     def get_signal_posts_for_digest(
@@ -303,25 +339,72 @@ class Repository:
         """
         with self.db.get_session() as session:
             results = session.execute(
-                select(RedditPost, Classification)
-                .join(Classification, RedditPost.id == Classification.post_id)
-                .where(Classification.project == project)
-                .where(Classification.category.in_(['technical', 'troubleshooting', 'research_verified']))
-                .where(Classification.sent_in_digest_at.is_(None))
-                .where(Classification.confidence >= min_confidence)
-                .order_by(RedditPost.score.desc(), Classification.confidence.desc())
-                .limit(limit)
+                self._digest_candidates(
+                    select(RedditPost, Classification), project, limit, min_confidence
+                )
             ).all()
 
             return [
                 {
                     'post': post.to_dict(),
                     'classification': classification.to_dict(),
-                    'selftext_truncated': len(post.selftext or '') == 5000
+                    'selftext_truncated': len(post.selftext or '') == settings.max_lines_article
                 }
                 for post, classification in results
             ]
 
+    def get_signal_posts_summary_for_digest(
+        self,
+        project: str,
+        limit: int = 15,
+        min_confidence: float = 0.7
+    ) -> List[Dict]:
+        """
+        Get the digest candidates as preview rows, without loading post bodies.
+
+        Same selection and order as get_signal_posts_for_digest(), but only the
+        columns the dry-run preview shows are selected.
+
+        Args:
+            project: Project name
+            limit: Maximum number of posts
+            min_confidence: Minimum confidence threshold
+
+        Returns:
+            List of dicts with title, score, category, confidence and selftext_truncated
+        """
+        truncated = func.coalesce(func.char_length(RedditPost.selftext), 0) == settings.max_lines_article
+
+        with self.db.get_session() as session:
+            results = session.execute(
+                self._digest_candidates(
+                    select(
+                        RedditPost.title,
+                        RedditPost.score,
+                        Classification.category,
+                        Classification.confidence,
+                        truncated.label('selftext_truncated'),
+                    ),
+                    project, limit, min_confidence
+                )
+            ).all()
+
+            return [dict(row._mapping) for row in results]
+
+    @staticmethod
+    def _digest_candidates(stmt, project: str, limit: int, min_confidence: float):
+        """Apply the digest candidate filters and ordering to a select over posts."""
+        return (
+            stmt
+            .join(Classification, RedditPost.id == Classification.post_id)
+            .where(Classification.project == project)
+            .where(Classification.category.in_(['technical', 'troubleshooting', 'research_verified']))
+            .where(Classification.sent_in_digest_at.is_(None))
+            .where(Classification.confidence >= min_confidence)
+            .order_by(RedditPost.score.desc(), Classification.confidence.desc())
+            .limit(limit)
+        )
+
     def mark_posts_as_sent_in_digest(
         self,
         post_ids: List[str],
@@ -1,10 +1,13 @@
 """Daily digest generation for ClaudeRedditor."""
 
 import json
+import re
+import string
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
-from anthropic import Anthropic
+from typing import List, Dict, Optional, Tuple
+from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 import logging
 
@@ -12,30 +15,140 @@ from .config import settings
 from .projects import project_loader
 from .db.repository import Repository
 from .content_fetcher import fetch_full_content
+from .core import serialization
+from .classifier import get_anthropic_client
 
 logger = logging.getLogger(__name__)
 
+# JSON wrapped in ```json ... ``` (or bare ```) code blocks
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+# Post ID prefix (before the first '_') -> human-readable source name
+SOURCE_NAMES = {
+    'reddit': 'Reddit',
+    'hn': 'HackerNews',
+}
+
+
+def source_for_post_id(post_id: str) -> str:
+    """Return the source name for a prefixed post ID ('Unknown' if unrecognized)."""
+    prefix, sep, _ = post_id.partition('_')
+    return SOURCE_NAMES.get(prefix, 'Unknown') if sep else 'Unknown'
+
+
+def story_source_label(post_id: str, subreddit: Optional[str] = None) -> str:
+    """Return the source label shown in web stories ('r/{subreddit}' for Reddit posts)."""
+    source = source_for_post_id(post_id)
+    if source == 'Reddit' and subreddit:
+        return f"r/{subreddit}"
+    return source
+
+
+_SECTION_RE = re.compile(r'^(?=## )', re.MULTILINE)
+
+
+def split_prompt_template(template: str) -> Tuple[str, str]:
+    """
+    Split a digest prompt template into a static prefix and a per-post part.
+
+    The prefix is every Markdown section ("## ...") before the first one that
+    contains format placeholders (the source post fields). It is identical for
+    all posts and can be sent as a cacheable prompt prefix. Everything from the
+    first placeholder section on stays in the per-post part, so the prompt
+    keeps its original section order: static_text + post_template.format(...)
+    equals template.format(...).
+
+    Returns:
+        (static_text, post_template). static_text is already unescaped
+        ('{{' -> '{') and empty if the template starts with placeholders or
+        has none; post_template still needs .format(**fields).
+    """
+    formatter = string.Formatter()
+    sections = _SECTION_RE.split(template)
+    for i, section in enumerate(sections):
+        if any(field is not None for _, field, _, _ in formatter.parse(section)):
+            break
+    else:
+        return '', template
+
+    static_text = ''.join(sections[:i]).replace('{{', '{').replace('}}', '}')
+    if not static_text.strip():
+        return '', template
+    return static_text, ''.join(sections[i:])
+
+
+def extract_json(text: str) -> Optional[Dict]:
+    """
+    Extract a JSON object from a Claude response, handling various formats.
+
+    Handles:
+    - Raw JSON (parsed directly)
+    - JSON wrapped in ```json ... ``` or ``` ... ``` code blocks
+    - JSON embedded in surrounding prose
+
+    For embedded JSON every '{' is tried as a candidate start and decoded with
+    ``JSONDecoder.raw_decode``, so the scan runs in C instead of counting braces
+    character by character. The largest object that parses wins.
+
+    Returns:
+        Parsed dict, or None if no JSON object could be found
+    """
+    text = text.strip()
+    try:
+        data = serialization.loads(text)
+        if isinstance(data, dict):
+            return data
+    except json.JSONDecodeError:
+        pass
+
+    match = _CODE_BLOCK_RE.search(text)
+    if match:
+        try:
+            return serialization.loads(match.group(1))
+        except json.JSONDecodeError:
+            pass
+
+    best = None
+    best_len = 0
+    pos = text.find('{')
+    while pos != -1:
+        try:
+            obj, end = _JSON_DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            pos = text.find('{', pos + 1)
+            continue
+        if isinstance(obj, dict) and end - pos > best_len:
+            best, best_len = obj, end - pos
+        # Nested objects inside a decoded span can never be larger
+        pos = text.find('{', end)
+
+    return best
+
 
 class DigestGenerator:
     """Generate daily digest of top signal posts."""
 
-    def __init__(self, repo: Repository, project: str = 'claudeia'):
+    def __init__(self, repo: Repository, project: str = 'claudeia', console: Optional[Console] = None):
         """
         Initialize digest generator.
 
         Args:
             repo: Repository instance for database access
             project: Project name for loading prompts
+            console: Console for progress output (default: Rich's global one)
         """
         self.repo = repo
         self.project = project
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
-        self._prompt_cache: Dict[str, str] = {}
+        self.console = console
+        self.client = get_anthropic_client(settings.anthropic_api_key)
+        self._prompt_cache: Dict[str, Tuple[str, str]] = {}
 
-    def _get_prompt_template(self, project: str) -> str:
-        """Load the digest prompt template for a project."""
+    def _get_prompt_parts(self, project: str) -> Tuple[str, str]:
+        """Load the digest prompt for a project, split into (static, per-post) parts."""
         if project not in self._prompt_cache:
-            self._prompt_cache[project] = project_loader.get_prompt(project, 'digest')
+            template = project_loader.get_prompt(project, 'digest')
+            self._prompt_cache[project] = split_prompt_template(template)
         return self._prompt_cache[project]
 
     def generate(
@@ -71,43 +184,9 @@ class DigestGenerator:
 
         logger.info(f"Found {len(posts_data)} signal posts for digest")
 
-        # 2. Process each post
-        articles = []
-        processed_ids = []
-
-        if show_progress:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                transient=True,
-            ) as progress:
-                task = progress.add_task("Generating articles...", total=len(posts_data))
-
-                for item in posts_data:
-                    post = item['post']
-                    classification = item['classification']
-
-                    progress.update(task, description=f"Processing: {post.get('title', '')[:40]}...")
-
-                    article = self._process_post(item)
-
-                    if article:
-                        articles.append({
-                            'post': post,
-                            'article': article
-                        })
-                        processed_ids.append(post['id'])
-
-                    progress.advance(task)
-        else:
-            for item in posts_data:
-                article = self._process_post(item)
-                if article:
-                    articles.append({
-                        'post': item['post'],
-                        'article': article
-                    })
-                    processed_ids.append(item['post']['id'])
+        # 2. Process posts (Claude calls run concurrently)
+        articles = self._process_posts(posts_data, show_progress)
+        processed_ids = [art['post']['id'] for art in articles]
 
         if not articles:
             raise ValueError("Failed to generate any articles. Check API connectivity.")
@@ -159,42 +238,8 @@ class DigestGenerator:
         logger.info(f"Found {len(posts_data)} signal posts for digest (both formats)")
 
         # 2. Process posts for markdown (generate articles via Claude)
-        articles = []
-        processed_ids = []
-
-        if show_progress:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                transient=True,
-            ) as progress:
-                task = progress.add_task("Generating articles...", total=len(posts_data))
-
-                for item in posts_data:
-                    post = item['post']
-                    progress.update(task, description=f"Processing: {post.get('title', '')[:40]}...")
-
-                    article = self._process_post(item)
-
-                    if article:
-                        articles.append({
-                            'post': post,
-                            'article': article,
-                            'item': item  # Keep original item for JSON
-                        })
-                        processed_ids.append(post['id'])
-
-                    progress.advance(task)
-        else:
-            for item in posts_data:
-                article = self._process_post(item)
-                if article:
-                    articles.append({
-                        'post': item['post'],
-                        'article': article,
-                        'item': item
-                    })
-                    processed_ids.append(item['post']['id'])
+        articles = self._process_posts(posts_data, show_progress)
+        processed_ids = [art['post']['id'] for art in articles]
 
         if not articles:
             raise ValueError("Failed to generate any articles. Check API connectivity.")
@@ -238,7 +283,7 @@ class DigestGenerator:
         }
 
         json_path = json_output_dir / f"{project}_{date_str}_{seq_num:02d}.json"
-        json_path.write_text(json.dumps(digest_data, indent=2, ensure_ascii=False), encoding='utf-8')
+        json_path.write_text(serialization.dumps(digest_data, indent=True), encoding='utf-8')
 
         # Update latest.json symlink
         latest_path = json_output_dir / "latest.json"
@@ -252,6 +297,68 @@ class DigestGenerator:
         logger.info(f"Both digests generated: {md_path}, {json_path} ({len(articles)} articles)")
         return md_path, json_path
 
+    def _process_posts(self, posts_data: List[Dict], show_progress: bool = True) -> List[Dict]:
+        """
+        Generate articles for all posts, running up to settings.max_concurrent_api
+        Claude calls in parallel. Each call is network-bound, so threads give a
+        near-linear speedup over the sequential loop.
+
+        Args:
+            posts_data: Items from get_signal_posts_for_digest()
+            show_progress: Show progress spinner
+
+        Returns:
+            List of {'post', 'article', 'item'} dicts in the original post order,
+            skipping posts whose article generation failed
+        """
+        results: List[Optional[Dict]] = [None] * len(posts_data)
+        max_workers = max(1, min(settings.max_concurrent_api, len(posts_data)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._process_post, item): idx
+                for idx, item in enumerate(posts_data)
+            }
+
+            def collect(on_done=None):
+                try:
+                    for future in as_completed(futures):
+                        idx = futures[future]
+                        results[idx] = future.result()
+                        if on_done:
+                            on_done(posts_data[idx])
+                except Exception:
+                    # Fatal error (e.g. credits exhausted): don't start pending posts
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+            if show_progress:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    transient=True,
+                    console=self.console,
+                ) as progress:
+                    task = progress.add_task("Generating articles...", total=len(posts_data))
+
+                    def advance(item: Dict) -> None:
+                        progress.update(
+                            task,
+                            advance=1,
+                            description=f"Processed: {item['post'].get('title', '')[:40]}..."
+                        )
+
+                    collect(advance)
+            else:
+                collect()
+
+        return [
+            {'post': item['post'], 'article': article, 'item': item}
+            for item, article in zip(posts_data, results)
+            if article
+        ]
+
     def _process_post(self, item: Dict) -> Optional[Dict]:
         """
         Process a single post: fetch content if needed and generate article.
@@ -297,20 +404,14 @@ class DigestGenerator:
         Returns:
             Dict with article_title, article_body, radio_commentary or None
         """
-        # Determine source type
-        post_id = post.get('id', '')
-        if post_id.startswith('reddit_'):
-            source = 'Reddit'
-        elif post_id.startswith('hn_'):
-            source = 'HackerNews'
-        else:
-            source = 'Unknown'
-
-        # Prepare prompt using project-specific template
-        prompt_template = self._get_prompt_template(self.project)
-        prompt = prompt_template.format(
+        # Prepare prompt using project-specific template. The static leading
+        # sections go first with cache_control so Anthropic can reuse them across
+        # posts (only effective once they exceed the model's minimum cacheable
+        # length); section order is the template's own.
+        static_text, post_template = self._get_prompt_parts(self.project)
+        post_text = post_template.format(
             title=post.get('title', 'Sin título'),
-            source=source,
+            source=source_for_post_id(post.get('id', '')),
             subreddit=post.get('subreddit', 'N/A') or 'N/A',
             author=post.get('author', 'unknown') or 'unknown',
             score=post.get('score', 0) or 0,
@@ -319,18 +420,26 @@ class DigestGenerator:
             url=post.get('url', ''),
             content=content[:10000] if content else 'No content available'
         )
+        content_blocks = []
+        if static_text:
+            content_blocks.append({
+                "type": "text",
+                "text": static_text,
+                "cache_control": {"type": "ephemeral"},
+            })
+        content_blocks.append({"type": "text", "text": post_text})
 
         try:
             response = self.client.messages.create(
                 model=settings.anthropic_model,
                 max_tokens=4096,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": content_blocks}]
             )
 
             response_text = response.content[0].text
 
             # Extract JSON from response - handle markdown code blocks
-            article = self._extract_json(response_text)
+            article = extract_json(response_text)
 
             if article:
                 # Validate required fields
@@ -351,73 +460,6 @@ class DigestGenerator:
 
         return None
 
-    def _extract_json(self, text: str) -> Optional[Dict]:
-        """
-        Extract JSON from Claude response, handling various formats.
-
-        Handles:
-        - Raw JSON
-        - JSON wrapped in ```json ... ``` code blocks
-        - JSON wrapped in ``` ... ``` code blocks
-        """
-        import re
-
-        # Try to find JSON in code block first (greedy match for nested braces)
-        # Look for opening ``` with optional json, then capture until closing ```
-        code_block_pattern = r'```(?:json)?\s*(\{.*\})\s*```'
-        match = re.search(code_block_pattern, text, re.DOTALL)
-        if match:
-            json_str = match.group(1)
-            try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                # Try cleaning the extracted string
-                pass
-
-        # Fallback: find raw JSON object using brace matching
-        json_start = text.find('{')
-        if json_start == -1:
-            return None
-
-        # Find the matching closing brace by counting
-        brace_count = 0
-        json_end = -1
-        in_string = False
-        escape_next = False
-
-        for i, char in enumerate(text[json_start:], start=json_start):
-            if escape_next:
-                escape_next = False
-                continue
-            if char == '\\' and in_string:
-                escape_next = True
-                continue
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            if not in_string:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        json_end = i + 1
-                        break
-
-        if json_end > json_start:
-            json_str = text[json_start:json_end]
-            try:
-                return json.loads(json_str)
-            except json.JSONDecodeError as e:
-                logger.warning(f"JSON parse error: {e}")
-                # Log the problematic area for debugging
-                if hasattr(e, 'pos') and e.pos:
-                    start = max(0, e.pos - 30)
-                    end = min(len(json_str), e.pos + 30)
-                    logger.warning(f"Error context: ...{json_str[start:end]}...")
-
-        return None
-
     def _write_markdown(
         self,
         articles: List[Dict],
@@ -540,6 +582,7 @@ class DigestGenerator:
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 transient=True,
+                console=self.console,
             ) as progress:
                 task = progress.add_task("Building JSON...", total=len(posts_data))
 
@@ -588,7 +631,7 @@ class DigestGenerator:
         }
 
         output_path = output_dir / f"{project}_{date_str}_{next_num:02d}.json"
-        output_path.write_text(json.dumps(digest_data, indent=2, ensure_ascii=False), encoding='utf-8')
+        output_path.write_text(serialization.dumps(digest_data, indent=True), encoding='utf-8')
 
         # 5. Update latest.json symlink
         latest_path = output_dir / "latest.json"
@@ -615,14 +658,8 @@ class DigestGenerator:
         post = item['post']
         classification = item['classification']
 
-        # Determine source
         post_id = post.get('id', '')
-        if post_id.startswith('reddit_'):
-            source = f"r/{post.get('subreddit', 'unknown')}"
-        elif post_id.startswith('hn_'):
-            source = "HackerNews"
-        else:
-            source = "Unknown"
+        source = story_source_label(post_id, post.get('subreddit'))
 
         # Story ID will be set later with digest sequence number
         return {
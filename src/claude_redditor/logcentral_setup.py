@@ -1,8 +1,12 @@
 """Configure stdlib logging to also write JSON to a LogCentral-compatible file."""
+import atexit
 import json
 import logging
 import os
+import queue
+import sys
 from datetime import timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 
@@ -32,18 +36,63 @@ class LogCentralHandler(logging.Handler):
             self.handleError(record)
 
 
+class ConsoleWarningHandler(logging.StreamHandler):
+    """
+    Show this package's warnings on the terminal (e.g. posts skipped during
+    classification). Third-party warnings stay in the log file only.
+
+    sys.stderr is looked up on every record rather than bound once, so while a
+    Rich progress display swaps it out the warning is printed above the bars.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setLevel(logging.WARNING)
+        self.setFormatter(logging.Formatter("⚠ %(message)s"))
+        self.addFilter(logging.Filter("claude_redditor"))
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
+
+
+class LogCentralQueueHandler(QueueHandler):
+    """Queue front-end for LogCentralHandler (identifies it on the root logger)."""
+
+
 def setup_logcentral(log_dir: Path | None = None) -> None:
-    """Add LogCentral JSON handler to root logger."""
+    """
+    Add LogCentral JSON handler to root logger.
+
+    The file handler runs on a QueueListener thread, so logging threads
+    (e.g. concurrent classifier batches) only enqueue records instead of
+    opening and writing the log file themselves. Warnings are also echoed
+    to stderr from the same thread.
+    """
     resolved_dir = Path(log_dir or os.getenv("LOGCENTRAL_LOG_DIR", "logs"))
     log_file = resolved_dir / "clauderedditor.log"
 
+    root_logger = logging.getLogger()
+    # Avoid duplicate handlers if called twice
+    if any(isinstance(h, LogCentralQueueHandler) for h in root_logger.handlers):
+        return
+
     handler = LogCentralHandler(log_file)
     handler.setLevel(logging.INFO)
 
-    root_logger = logging.getLogger()
-    # Avoid duplicate handlers if called twice
-    if not any(isinstance(h, LogCentralHandler) for h in root_logger.handlers):
-        root_logger.addHandler(handler)
-        # Ensure root logger level allows INFO through
-        if root_logger.level == logging.NOTSET or root_logger.level > logging.INFO:
-            root_logger.setLevel(logging.INFO)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = LogCentralQueueHandler(log_queue)
+    queue_handler.setLevel(logging.INFO)
+
+    listener = QueueListener(log_queue, handler, ConsoleWarningHandler(), respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Drains queued records before exit
+
+    root_logger.addHandler(queue_handler)
+    # Ensure root logger level allows INFO through
+    if root_logger.level == logging.NOTSET or root_logger.level > logging.INFO:
+        root_logger.setLevel(logging.INFO)
@@ -3,7 +3,7 @@
 import yaml
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 
 @dataclass
@@ -75,6 +75,7 @@ class ProjectLoader:
         """
         self.projects_dir = projects_dir
         self._cache: Dict[str, Project] = {}
+        self._prompt_cache: Dict[Tuple[str, str], str] = {}
 
     def list_projects(self) -> List[str]:
         """
@@ -142,6 +143,11 @@ class ProjectLoader:
         Raises:
             FileNotFoundError: If prompt doesn't exist
         """
+        # Check cache first
+        key = (project_name, prompt_name)
+        if key in self._prompt_cache:
+            return self._prompt_cache[key]
+
         project = self.load(project_name)
         prompt_path = project.prompts_dir / f'{prompt_name}.md'
 
@@ -151,15 +157,18 @@ class ProjectLoader:
                 f"Expected at: {prompt_path}"
             )
 
-        return prompt_path.read_text()
+        prompt = prompt_path.read_text()
+        self._prompt_cache[key] = prompt
+        return prompt
 
     def project_exists(self, name: str) -> bool:
         """Check if a project exists."""
         return name in self.list_projects()
 
     def clear_cache(self) -> None:
-        """Clear the project cache (useful for testing)."""
+        """Clear the project and prompt caches (useful for testing)."""
         self._cache.clear()
+        self._prompt_cache.clear()
 
 
 def _find_projects_dir() -> Path:
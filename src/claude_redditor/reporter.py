@@ -1,8 +1,8 @@
 """Report generation and output formatting using Rich."""
 
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
 from rich.console import Console
@@ -11,17 +11,25 @@ from rich.panel import Panel
 from rich.layout import Layout
 from rich import box
 
+from .core import serialization
 from .core.models import AnalysisReport
-from .core.enums import CategoryEnum
+from .core.enums import CategoryEnum, CATEGORY_KIND
+from .analyzer import health_grade
 from .config import settings
 
 
 class ReportRenderer:
     """Renders analysis reports to terminal and exports to files."""
 
-    def __init__(self):
-        """Initialize renderer with Rich console."""
-        self.console = Console()
+    def __init__(self, console: Optional[Console] = None):
+        """
+        Initialize renderer with Rich console.
+
+        Args:
+            console: Console to print on (the CLI passes its shared one, so
+                reports render cleanly under its live progress displays)
+        """
+        self.console = console or Console()
 
     def render_terminal(self, report: AnalysisReport, show_details: bool = True) -> None:
         """
@@ -54,9 +62,8 @@ class ReportRenderer:
 
         # Add unrelated summary if applicable
         if report.unrelated_count > 0:
-            from rich import print as rprint
-            rprint()  # Blank line before
-            rprint(
+            self.console.print()  # Blank line before
+            self.console.print(
                 f"[dim]🔍 Unrelated:[/dim] [dim]{report.unrelated_count} "
                 f"post{'s' if report.unrelated_count != 1 else ''} filtered (off-topic)[/dim]"
             )
@@ -113,8 +120,7 @@ class ReportRenderer:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = settings.reports_dir / f"{report.subreddit}_{timestamp}.json"
 
-        with open(output_path, "w") as f:
-            json.dump(report.to_dict(), f, indent=2)
+        output_path.write_text(serialization.dumps(report.to_dict(), indent=True), encoding="utf-8")
 
         return output_path
 
@@ -133,23 +139,9 @@ class ReportRenderer:
 
     def _render_metrics_summary(self, report: AnalysisReport) -> None:
         """Render key metrics summary."""
-        signal_categories = CategoryEnum.signal_categories()
-        noise_categories = CategoryEnum.noise_categories()
-
-        signal_count = sum(
-            count for cat, count in report.category_counts.items()
-            if CategoryEnum(cat) in signal_categories
-        )
-
-        noise_count = sum(
-            count for cat, count in report.category_counts.items()
-            if CategoryEnum(cat) in noise_categories
-        )
-
-        meta_count = sum(
-            count for cat, count in report.category_counts.items()
-            if cat in [CategoryEnum.COMMUNITY.value, CategoryEnum.MEME.value]
-        )
+        signal_count = report.signal_count
+        noise_count = report.noise_count
+        meta_count = report.meta_count
 
         # Signal ratio bar
         signal_pct = report.signal_ratio * 100
@@ -184,13 +176,13 @@ class ReportRenderer:
         }
 
         for category, count in sorted(visible_categories.items(), key=lambda x: x[1], reverse=True):
-            cat_enum = CategoryEnum(category)
             percentage = (count / report.total_posts) * 100
 
             # Determine type
-            if CategoryEnum.is_signal(cat_enum):
+            kind = CATEGORY_KIND.get(category)
+            if kind == "signal":
                 cat_type = "[green]Signal[/green]"
-            elif cat_enum in CategoryEnum.noise_categories():
+            elif kind == "noise":
                 cat_type = "[red]Noise[/red]"
             else:
                 cat_type = "[yellow]Meta/Other[/yellow]"
@@ -239,20 +231,10 @@ class ReportRenderer:
 
     def _calculate_health_grade(self, signal_ratio: float) -> str:
         """Calculate health grade from signal ratio."""
-        if signal_ratio >= 0.8:
-            return "A+"
-        elif signal_ratio >= 0.7:
-            return "A"
-        elif signal_ratio >= 0.6:
-            return "B"
-        elif signal_ratio >= 0.5:
-            return "C"
-        elif signal_ratio >= 0.4:
-            return "D"
-        else:
-            return "F"
-
-
-def create_reporter() -> ReportRenderer:
-    """Factory function to create a ReportRenderer instance."""
-    return ReportRenderer()
+        return health_grade(signal_ratio)
+
+
+@lru_cache(maxsize=1)
+def create_reporter(console: Optional[Console] = None) -> ReportRenderer:
+    """Factory function to get the shared (stateless) ReportRenderer for a console."""
+    return ReportRenderer(console)
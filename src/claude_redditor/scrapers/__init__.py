@@ -1,7 +1,9 @@
 """Multi-source scraper package (Reddit, HackerNews, etc)."""
 
+from functools import lru_cache
 from typing import Optional, List
 
+from ..config import settings
 from .base import Post, BaseScraper, prefix_id
 from .reddit import RedditScraper
 from .hackernews import HackerNewsScraper
@@ -18,11 +20,22 @@ __all__ = [
 ]
 
 
-def create_reddit_scraper() -> RedditScraper:
-    """Factory function to create a RedditScraper instance."""
+@lru_cache(maxsize=1)
+def _get_reddit_scraper(client_id: Optional[str], client_secret: Optional[str]) -> RedditScraper:
+    """Build the RedditScraper for a given credential pair (cached)."""
     return RedditScraper()
 
 
+def create_reddit_scraper() -> RedditScraper:
+    """
+    Factory function to get the RedditScraper instance.
+
+    The instance is shared while the Reddit credentials stay the same, so the
+    PRAW client / HTTP session and the rate-limit clock survive across scans.
+    """
+    return _get_reddit_scraper(settings.reddit_client_id, settings.reddit_client_secret)
+
+
 def create_hn_scraper(keywords: Optional[List[str]] = None) -> HackerNewsScraper:
     """
     Factory function to create a HackerNewsScraper instance.
@@ -4,9 +4,13 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List, Optional
 from datetime import datetime
+import html
+import re
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
 
-@dataclass
+
+@dataclass(slots=True)
 class Post:
     """
     Generic post model that works across multiple sources (Reddit, HackerNews, etc).
@@ -92,6 +96,11 @@ def prefix_id(raw_id: str, source: str) -> str:
         return f"{source[:6]}_{raw_id}"
 
 
+def strip_html(text: str) -> str:
+    """Remove HTML tags and decode entities (&amp;, &#x27;, ...) from text."""
+    return html.unescape(_HTML_TAG_RE.sub("", text)).strip()
+
+
 class BaseScraper(ABC):
     """
     Abstract base class for all scrapers (Reddit, HackerNews, etc).
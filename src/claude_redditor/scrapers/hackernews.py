@@ -5,7 +5,7 @@ import requests
 from typing import List, Optional
 from datetime import datetime
 
-from .base import BaseScraper, Post, prefix_id
+from .base import BaseScraper, Post, prefix_id, strip_html
 
 
 class HackerNewsScraper(BaseScraper):
@@ -165,10 +165,8 @@ class HackerNewsScraper(BaseScraper):
 
         # Text content (HN "Ask HN", "Show HN", etc may have text)
         selftext = story.get("text", "")
-        # Remove HTML tags (basic approach)
         if selftext:
-            import re
-            selftext = re.sub(r"<[^>]+>", "", selftext)
+            selftext = strip_html(selftext)
 
         # External URL (for link posts)
         source_url = story.get("url", "")
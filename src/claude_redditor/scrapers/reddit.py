@@ -1,13 +1,52 @@
 """Reddit scraper with dual-mode support (RSS or PRAW)."""
 
-from typing import List
+from datetime import datetime
+from itertools import islice
+from typing import Iterator, List, Optional
+import atexit
+import calendar
+import io
+import threading
 import time
 import requests
 import feedparser
-import re
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+try:
+    from lxml import etree  # Optional: streaming Atom parser (faster than feedparser)
+except ImportError:
+    etree = None
 
 from ..config import settings
-from .base import BaseScraper, Post, prefix_id
+from .base import BaseScraper, Post, prefix_id, strip_html
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+
+class _RecordingReader:
+    """
+    File-like wrapper that keeps a copy of the bytes read (for parser fallback).
+
+    The copy is only needed until the first entry parses: call stop() then,
+    so a well-formed feed is not held in memory twice.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.buffer = bytearray()
+        self.recording = True
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.raw.read(size)
+        if self.recording:
+            self.buffer += data
+        return data
+
+    def stop(self) -> None:
+        self.recording = False
+        self.buffer = bytearray()
 
 
 class RedditScraper(BaseScraper):
@@ -21,6 +60,10 @@ class RedditScraper(BaseScraper):
         """Initialize scraper in appropriate mode based on available credentials."""
         self.mode = self._detect_mode()
         self.last_request_time = 0
+        self._rate_lock = threading.Lock()
+        # PRAW is not thread-safe: listing pages are pulled under this lock
+        # when several subreddits are scanned concurrently on one scraper
+        self._praw_lock = threading.Lock()
 
         if self.mode == "praw":
             self._init_praw()
@@ -33,7 +76,7 @@ class RedditScraper(BaseScraper):
 
     def _detect_mode(self) -> str:
         """Detect if Reddit credentials are available."""
-        if settings.reddit_client_id and settings.reddit_client_secret:
+        if settings.is_reddit_authenticated():
             return "praw"
         return "json"
 
@@ -61,16 +104,38 @@ class RedditScraper(BaseScraper):
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
+        # Reuse one keep-alive connection pool for all feed requests
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        atexit.register(self.session.close)
         self.rate_limit = 10
         print(f"✓ Reddit scraper: RSS mode ({self.rate_limit} req/min, no auth required)")
 
     def _rate_limit_wait(self):
-        """Rate limiting: 6 seconds for JSON mode to stay under 10 req/min."""
+        """
+        Rate limiting: 6 seconds between request starts in JSON mode to stay
+        under 10 req/min. Thread-safe: each caller reserves the next free slot
+        under the lock and sleeps outside it, so concurrent fetches are spaced
+        correctly while the previous request is still in flight.
+        """
         if self.mode == "json":
-            elapsed = time.time() - self.last_request_time
-            if elapsed < 6:
-                time.sleep(6 - elapsed)
-            self.last_request_time = time.time()
+            with self._rate_lock:
+                now = time.time()
+                slot = max(now, self.last_request_time + 6)
+                self.last_request_time = slot
+            if slot > now:
+                time.sleep(slot - now)
 
     def fetch_posts(
         self,
@@ -100,25 +165,72 @@ class RedditScraper(BaseScraper):
         else:
             return self._fetch_json(subreddit_name, limit, sort)
 
+    def iter_post_batches(
+        self,
+        subreddit_name: str,
+        limit: int = 100,
+        time_filter: str = "week",
+        sort: str = "hot",
+        batch_size: Optional[int] = None,
+    ) -> Iterator[List[Post]]:
+        """
+        Yield posts in lists of up to `batch_size` as they are fetched.
+
+        batch_size defaults to the classifier batch size, so each batch is
+        one Claude API request and callers can start classifying the first
+        batches while PRAW is still paging the listing (100 posts per
+        request). RSS returns the whole feed at once, so there only the
+        classification of the batches overlaps.
+
+        Safe to call from several threads: PRAW requests are serialized on
+        the scraper, only the consumers of the batches run concurrently.
+
+        Yields:
+            Lists of Post objects with prefixed IDs ("reddit_abc123")
+        """
+        if not subreddit_name:
+            raise ValueError("subreddit_name is required for RedditScraper")
+
+        batch_size = batch_size or settings.default_batch_size
+
+        if self.mode == "praw":
+            listing = map(self._normalize_praw_post, self._praw_listing(subreddit_name, limit, time_filter, sort))
+
+            def next_batch() -> List[Post]:
+                with self._praw_lock:
+                    return list(islice(listing, batch_size))
+        else:
+            posts = iter(self._fetch_json(subreddit_name, limit, sort))
+
+            def next_batch() -> List[Post]:
+                return list(islice(posts, batch_size))
+
+        while batch := next_batch():
+            yield batch
+
     def _fetch_praw(
         self, subreddit_name: str, limit: int, time_filter: str, sort: str
     ) -> List[Post]:
         """Fetch using PRAW."""
+        posts = self._praw_listing(subreddit_name, limit, time_filter, sort)
+        with self._praw_lock:
+            return [self._normalize_praw_post(post) for post in posts]
+
+    def _praw_listing(self, subreddit_name: str, limit: int, time_filter: str, sort: str):
+        """Return the lazy PRAW listing generator for the sort method."""
         subreddit = self.reddit.subreddit(subreddit_name)
 
         # Get posts based on sort method
         if sort == "hot":
-            posts = subreddit.hot(limit=limit)
+            return subreddit.hot(limit=limit)
         elif sort == "new":
-            posts = subreddit.new(limit=limit)
+            return subreddit.new(limit=limit)
         elif sort == "top":
-            posts = subreddit.top(time_filter=time_filter, limit=limit)
+            return subreddit.top(time_filter=time_filter, limit=limit)
         elif sort == "rising":
-            posts = subreddit.rising(limit=limit)
+            return subreddit.rising(limit=limit)
         else:
-            posts = subreddit.hot(limit=limit)
-
-        return [self._normalize_praw_post(post) for post in posts]
+            return subreddit.hot(limit=limit)
 
     def _fetch_json(
         self, subreddit_name: str, limit: int, sort: str
@@ -135,26 +247,119 @@ class RedditScraper(BaseScraper):
             url = f"https://www.reddit.com/r/{subreddit_name}/.rss"
 
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            # With lxml the body is streamed, so parsing stops once `limit`
+            # entries are read instead of building every entry of the feed
+            response = self.session.get(url, timeout=10, stream=etree is not None)
+        except requests.exceptions.RequestException as e:
+            print(f"⚠ Error fetching RSS feed: {e}")
+            return []
 
-            # Parse RSS feed
-            feed = feedparser.parse(response.content)
+        try:
+            response.raise_for_status()
 
-            if not feed.entries:
+            posts = None
+            if etree is not None:
+                response.raw.decode_content = True
+                reader = _RecordingReader(response.raw)
+                posts = []
+                try:
+                    for post in self._iter_atom_entries(reader, subreddit_name):
+                        reader.stop()
+                        posts.append(post)
+                        if len(posts) >= limit:
+                            break
+                except etree.XMLSyntaxError:
+                    pass  # Entries parsed before the error are complete and kept
+                if not posts:
+                    # Malformed feed, or no Atom entries (e.g. an RSS 2.0 body):
+                    # hand everything to feedparser's lenient parser
+                    content = bytes(reader.buffer) + response.raw.read()
+                    posts = None
+                else:
+                    # Read the rest of the body so the connection goes back to
+                    # the keep-alive pool instead of being closed half-read
+                    for _ in response.iter_content(chunk_size=65536):
+                        pass
+            else:
+                content = response.content
+
+            if posts is None:
+                # Parse RSS feed. Passing the HTTP content type (Reddit sends
+                # charset=UTF-8) lets feedparser skip encoding detection.
+                feed = feedparser.parse(
+                    content,
+                    response_headers={
+                        "content-type": response.headers.get(
+                            "Content-Type", "application/atom+xml; charset=UTF-8"
+                        )
+                    },
+                )
+                posts = [
+                    self._normalize_rss_entry(entry, subreddit_name)
+                    for entry in feed.entries[:limit]
+                ]
+
+            if not posts:
                 print(f"⚠ No posts found in RSS feed for r/{subreddit_name}")
-                return []
-
-            # Convert RSS entries to Post objects
-            posts = []
-            for entry in feed.entries[:limit]:
-                posts.append(self._normalize_rss_entry(entry, subreddit_name))
 
             return posts
 
-        except requests.exceptions.RequestException as e:
+        # The streamed body is read straight from response.raw, so a timeout or
+        # reset mid-body surfaces as urllib3's error rather than requests'
+        except (requests.exceptions.RequestException, Urllib3HTTPError) as e:
             print(f"⚠ Error fetching RSS feed: {e}")
             return []
+        finally:
+            response.close()
+
+    def _iter_atom_entries(self, source, subreddit_name: str) -> Iterator[Post]:
+        """
+        Stream-parse a Reddit Atom feed with lxml, yielding one Post per entry.
+
+        Each <entry> is normalized and then cleared as soon as it is complete,
+        and the caller can stop early, so only the entries it keeps are ever
+        turned into Python objects.
+
+        Args:
+            source: Feed as bytes or a binary file-like object (e.g. response.raw)
+        """
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+
+        for _, elem in etree.iterparse(source, events=("end",), tag=f"{_ATOM_NS}entry"):
+            yield self._normalize_atom_element(elem, subreddit_name)
+            elem.clear()
+
+    def _normalize_atom_element(self, elem, subreddit_name: str) -> Post:
+        """Normalize an lxml Atom <entry> element to Post (same fields as the RSS path)."""
+        entry_id = elem.findtext(f"{_ATOM_NS}id") or "unknown"
+        link_elem = elem.find(f"{_ATOM_NS}link")
+        link = link_elem.get("href", "") if link_elem is not None else ""
+        content_html = elem.findtext(f"{_ATOM_NS}content") or elem.findtext(f"{_ATOM_NS}summary") or ""
+
+        created_utc = 0.0
+        timestamp = elem.findtext(f"{_ATOM_NS}published") or elem.findtext(f"{_ATOM_NS}updated")
+        if timestamp:
+            try:
+                created_utc = datetime.fromisoformat(timestamp).timestamp()
+            except ValueError:
+                pass
+
+        return Post(
+            id=prefix_id(entry_id.split("_")[-1], "reddit"),
+            source="reddit",
+            title=elem.findtext(f"{_ATOM_NS}title") or "[No title]",
+            selftext=strip_html(content_html)[:settings.max_lines_article],
+            author=elem.findtext(f"{_ATOM_NS}author/{_ATOM_NS}name") or "[unknown]",
+            score=0,  # Not available in RSS
+            num_comments=0,  # Not available in RSS
+            created_utc=created_utc,
+            url=link,
+            source_url=link,
+            subreddit=subreddit_name,
+            flair=None,  # Not available in RSS
+            hn_type=None,
+        )
 
     def _normalize_praw_post(self, post) -> Post:
         """Normalize PRAW post object to Post with prefixed ID."""
@@ -198,17 +403,16 @@ class RedditScraper(BaseScraper):
         if hasattr(entry, "content") and entry.content:
             # RSS content is HTML, extract text portion
             content_html = entry.content[0].get("value", "")
-            # Simple HTML tag removal (basic approach)
-            selftext = re.sub(r"<[^>]+>", "", content_html).strip()
+            selftext = strip_html(content_html)
         elif hasattr(entry, "summary"):
-            selftext = re.sub(r"<[^>]+>", "", entry.summary).strip()
+            selftext = strip_html(entry.summary)
 
-        # Parse timestamp
+        # Parse timestamp (feedparser's *_parsed structs are in UTC)
         created_utc = 0.0
         if hasattr(entry, "published_parsed") and entry.published_parsed:
-            created_utc = time.mktime(entry.published_parsed)
+            created_utc = float(calendar.timegm(entry.published_parsed))
         elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-            created_utc = time.mktime(entry.updated_parsed)
+            created_utc = float(calendar.timegm(entry.updated_parsed))
 
         return Post(
             id=prefixed_id,
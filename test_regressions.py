@@ -0,0 +1,184 @@
+"""Offline regression tests (no API keys, network or database needed).
+
+Run directly (python test_regressions.py) or with pytest.
+"""
+
+import io
+import string
+import sys
+import threading
+import types
+from collections import OrderedDict
+from pathlib import Path
+
+sys.path.insert(0, 'src')
+
+import requests
+import urllib3
+from urllib3.exceptions import ProtocolError
+
+from claude_redditor.classifier import PostClassifier
+from claude_redditor.core.enums import CategoryEnum
+from claude_redditor.core.models import Classification, RedditPost
+from claude_redditor.digest import split_prompt_template
+from claude_redditor.scrapers.reddit import RedditScraper
+
+FIELDS = {'title': 'A title', 'content': 'Some {braced} text', 'url': 'https://example.com'}
+
+
+# split_prompt_template
+
+def test_split_prompt_template_keeps_section_order():
+    """Static sections after the first placeholder section stay in place."""
+    template = (
+        "## Role\nYou write digests.\n\n"
+        "## Post\nTitle: {title}\nURL: {url}\n\n"
+        "## Output\nReturn {{\"summary\": ...}}\n\n"
+        "## Content\n{content}\n"
+    )
+    static_text, post_template = split_prompt_template(template)
+
+    assert static_text == "## Role\nYou write digests.\n\n"
+    assert static_text + post_template.format(**FIELDS) == template.format(**FIELDS)
+
+
+def test_split_prompt_template_without_static_prefix():
+    """Templates starting with placeholders (or without any) are not split."""
+    for template in ("## Post\n{title}\n\n## Rules\nBe brief.\n", "## Rules\nBe brief.\n"):
+        assert split_prompt_template(template) == ('', template)
+
+
+def test_split_prompt_template_project_prompts():
+    """The shipped digest prompts render identically after splitting."""
+    for path in Path('src/claude_redditor/projects').glob('*/prompts/digest.md'):
+        template = path.read_text(encoding='utf-8')
+        static_text, post_template = split_prompt_template(template)
+        fields = {
+            field: 'x'
+            for _, field, _, _ in string.Formatter().parse(template)
+            if field
+        }
+        assert static_text + post_template.format(**fields) == template.format(**fields), path
+
+
+# RedditScraper._fetch_json
+
+class _BrokenRaw:
+    """urllib3 response body whose connection drops after the first chunk."""
+
+    decode_content = False
+
+    def __init__(self):
+        self.chunks = [b'<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">']
+
+    def read(self, size=-1):
+        if self.chunks:
+            return self.chunks.pop(0)
+        raise ProtocolError("Connection broken: IncompleteRead(0 bytes read)")
+
+
+class _BrokenResponse:
+    headers = {}
+
+    def __init__(self):
+        self.raw = _BrokenRaw()
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    @property
+    def content(self):
+        raise ProtocolError("Connection broken: IncompleteRead(0 bytes read)")
+
+    def close(self):
+        self.closed = True
+
+
+def test_fetch_json_connection_error_mid_stream():
+    """A connection dropped while streaming the feed returns no posts."""
+    response = _BrokenResponse()
+    scraper = RedditScraper.__new__(RedditScraper)
+    scraper.mode = 'json'
+    scraper.session = types.SimpleNamespace(get=lambda url, **kwargs: response)
+    scraper._rate_limit_wait = lambda: None
+
+    assert scraper._fetch_json('ClaudeAI', limit=10, sort='hot') == []
+    assert response.closed
+
+
+def test_fetch_json_falls_back_without_atom_entries():
+    """A feed with no Atom entries (here RSS 2.0) is handed to feedparser."""
+    body = (
+        b'<?xml version="1.0"?><rss version="2.0"><channel><title>r/ClaudeAI</title>'
+        b'<item><title>An RSS item</title><link>https://www.reddit.com/r/ClaudeAI/1</link>'
+        b'<guid>t3_1</guid><description>text</description></item></channel></rss>'
+    )
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = urllib3.HTTPResponse(io.BytesIO(body), preload_content=False, status=200)
+    scraper = RedditScraper.__new__(RedditScraper)
+    scraper.mode = 'json'
+    scraper.session = types.SimpleNamespace(get=lambda url, **kwargs: response)
+    scraper._rate_limit_wait = lambda: None
+
+    assert [post.title for post in scraper._fetch_json('ClaudeAI', limit=10, sort='hot')] == ['An RSS item']
+
+
+# PostClassifier content memo
+
+def _memo_classifier():
+    """Classifier without an API client; records the posts sent to the API."""
+    classifier = PostClassifier.__new__(PostClassifier)
+    classifier._content_memo = OrderedDict()
+    classifier._memo_lock = threading.Lock()
+    classifier.api_calls = []
+
+    def classify_uncached(posts, batch_size, project, batch_done):
+        if not posts:
+            return []
+        classifier.api_calls.append([post.id for post in posts])
+        return [Classification(post.id, CategoryEnum.TECHNICAL, 0.9) for post in posts]
+
+    classifier._classify_uncached = classify_uncached
+    return classifier
+
+
+def _post(post_id, title='Same title'):
+    return RedditPost(post_id, title, 'body', 'author', 1, 0, 0.0, 'https://example.com', 'ClaudeAI')
+
+
+def test_content_memo_reuses_identical_content():
+    """By default, content classified earlier in the process skips the API."""
+    classifier = _memo_classifier()
+    classifier.classify_posts([_post('reddit_a')])
+    result = classifier.classify_posts([_post('reddit_b')])
+
+    assert classifier.api_calls == [['reddit_a']]
+    assert [c.post_id for c in result] == ['reddit_b']
+
+
+def test_content_memo_skipped_without_cache():
+    """use_memo=False (scan --no-cache) sends every post to the API."""
+    classifier = _memo_classifier()
+    classifier.classify_posts([_post('reddit_a')], use_memo=False)
+    result = classifier.classify_posts([_post('reddit_b'), _post('reddit_c')], use_memo=False)
+
+    assert classifier.api_calls == [['reddit_a'], ['reddit_b', 'reddit_c']]
+    assert [c.post_id for c in result] == ['reddit_b', 'reddit_c']
+    assert not classifier._content_memo
+
+
+if __name__ == '__main__':
+    tests = [(name, fn) for name, fn in list(globals().items()) if name.startswith('test_') and callable(fn)]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+        except Exception as e:
+            failed += 1
+            print(f"✗ {name}: {e!r}")
+        else:
+            print(f"✓ {name}")
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(1 if failed else 0)